@@ -1,5 +1,6 @@
 """Fetch charity data from the Charity Commission."""
 
+import itertools
 import os
 import re
 from dataclasses import dataclass
@@ -428,7 +429,12 @@ def find_charity_number(pages: list[ExtractedPage]) -> str | None:
         if p.page_type.value in ['about', 'contact', 'home']
     ]
 
-    all_pages_to_search = priority_pages + [p for p in pages if p not in priority_pages]
+    # Identity, not dataclass equality, decides membership; chaining avoids
+    # building a merged list when an early page matches
+    priority_ids = {id(p) for p in priority_pages}
+    all_pages_to_search = itertools.chain(
+        priority_pages, (p for p in pages if id(p) not in priority_ids)
+    )
 
     for page in all_pages_to_search:
         text_lower = page.body_text.lower()
@@ -0,0 +1,36 @@
+"""Tests for charity number search in the Charity Commission enricher."""
+
+from llmstxt_core.enrichers.charity_commission import find_charity_number
+from llmstxt_core.extractor import ExtractedPage, PageType
+
+
+def _page(url, body_text, page_type):
+    return ExtractedPage(
+        url=url,
+        title="Test",
+        description=None,
+        headings=[],
+        body_text=body_text,
+        page_type=page_type,
+    )
+
+
+def test_find_charity_number_searches_priority_pages_first():
+    pages = [
+        _page("https://example.org/news", "Registered charity no. 1111111", PageType.NEWS),
+        _page("https://example.org/about", "Registered charity no. 2222222", PageType.ABOUT),
+    ]
+
+    assert find_charity_number(pages) == "2222222"
+
+
+def test_find_charity_number_searches_remaining_pages():
+    # Priority pages are not searched twice, and no other page is skipped
+    pages = [
+        _page("https://example.org/news", "Latest news", PageType.NEWS),
+        _page("https://example.org", "Welcome", PageType.HOME),
+        _page("https://example.org/other", "Charity number: 3333333", PageType.OTHER),
+    ]
+
+    assert find_charity_number(pages) == "3333333"
+    assert find_charity_number(pages[:2]) is None
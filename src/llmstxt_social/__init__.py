@@ -1,3 +1,36 @@
 """llmstxt-social: Generate llms.txt files for UK social sector organisations."""
 
+import importlib
+
 __version__ = "0.2.0"
+
+# Public names and the submodules that define them. Submodules pull in heavy
+# dependencies (anthropic, pandas, lxml, playwright), so they are imported on
+# first attribute access (PEP 562) rather than with the package.
+_LAZY = {
+    "Page": ".crawler",
+    "crawl_site": ".crawler",
+    "ExtractedPage": ".extractor",
+    "PageType": ".extractor",
+    "extract_content": ".extractor",
+    "analyze_organisation": ".analyzer",
+    "generate_llmstxt": ".generator",
+    "ValidationResult": ".validator",
+    "validate_llmstxt": ".validator",
+    "LLMSTxtAssessor": ".assessor",
+}
+
+__all__ = ["__version__", *_LAZY]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
@@ -1,18 +1,38 @@
 """LLM-based content analysis for organisations."""
 
-import json
+import asyncio
+import functools
+import logging
 import os
-from dataclasses import dataclass
-from anthropic import Anthropic
+import typing
+import weakref
+from dataclasses import dataclass, fields
+from anthropic import Anthropic, AsyncAnthropic
 from dotenv import load_dotenv
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speedup
+    import json as _json
+
 from .extractor import ExtractedPage
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Beta flag for the 1-hour prompt cache TTL (see _long_cache)
+_EXTENDED_CACHE_TTL_BETA = "extended-cache-ttl-2025-04-11"
+
+# AsyncAnthropic clients own an httpx connection pool bound to the event loop
+# that first used them, so clients are shared per event loop and API key.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncAnthropic]] = (
+    weakref.WeakKeyDictionary()
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class OrganisationAnalysis:
     """Analysis results for a charity/VCSE organisation."""
     name: str
@@ -31,7 +51,7 @@ class OrganisationAnalysis:
     ai_guidance: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class FunderAnalysis:
     """Analysis results for a funder/foundation."""
     name: str
@@ -52,7 +72,7 @@ class FunderAnalysis:
     ai_guidance: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PublicSectorAnalysis:
     """Analysis results for a public sector organisation."""
     name: str
@@ -67,7 +87,7 @@ class PublicSectorAnalysis:
     ai_guidance: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class StartupAnalysis:
     """Analysis results for a startup/tech company."""
     name: str
@@ -85,6 +105,45 @@ class StartupAnalysis:
     ai_guidance: list[str]
 
 
+_ANALYSIS_CLASSES = {
+    "charity": OrganisationAnalysis,
+    "funder": FunderAnalysis,
+    "public_sector": PublicSectorAnalysis,
+    "startup": StartupAnalysis,
+}
+
+# Factories for fields that default to an empty value rather than None when
+# Claude omits them from its response.
+_FIELD_DEFAULTS = {
+    OrganisationAnalysis: {
+        "services": list,
+        "themes": list,
+        "contact": dict,
+        "ai_guidance": list,
+    },
+    FunderAnalysis: {
+        "thematic_focus": list,
+        "programmes": list,
+        "grant_sizes": dict,
+        "who_can_apply": list,
+        "who_cannot_apply": list,
+        "application_process": str,
+        "contact": dict,
+        "success_factors": list,
+        "ai_guidance": list,
+    },
+    PublicSectorAnalysis: {
+        "services": list,
+        "contact": dict,
+        "ai_guidance": list,
+    },
+    StartupAnalysis: {
+        "contact": dict,
+        "ai_guidance": list,
+    },
+}
+
+
 CHARITY_SYSTEM_PROMPT = """You are analyzing a UK VCSE (voluntary, community, social enterprise) organisation's website to create an llms.txt file.
 
 Given the extracted content from their website pages, identify and return as JSON:
@@ -217,6 +276,14 @@ If information isn't available, use null.
 Focus on information that would help customers understand the product and investors understand the opportunity."""
 
 
+_SYSTEM_PROMPTS = {
+    "charity": CHARITY_SYSTEM_PROMPT,
+    "funder": FUNDER_SYSTEM_PROMPT,
+    "public_sector": PUBLIC_SECTOR_SYSTEM_PROMPT,
+    "startup": STARTUP_SYSTEM_PROMPT,
+}
+
+
 async def analyze_organisation(
     pages: list[ExtractedPage],
     template: str = "charity",
@@ -241,36 +308,182 @@ async def analyze_organisation(
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
 
-    # Prepare the content for Claude
-    content = _prepare_content(pages)
+    # Call Claude API
+    client = _get_client(api_key)
+
+    message = await client.messages.create(
+        **_request_params(pages, template, model),
+        extra_headers=_cache_headers()
+    )
+
+    _record_usage(message.usage)
+
+    return _parse_response(message.content[0].text, template)
+
+
+async def analyze_organisations(
+    pages_list: list[list[ExtractedPage]],
+    template: str = "charity",
+    model: str = "claude-sonnet-4-20250514",
+    api_key: str | None = None,
+    poll_interval: float = 30.0
+) -> list[OrganisationAnalysis | FunderAnalysis | PublicSectorAnalysis | StartupAnalysis | None]:
+    """
+    Analyze several organisations in one Message Batches API request.
+
+    Batches are processed asynchronously by Anthropic and can take minutes to
+    complete, so this suits bulk jobs rather than interactive use.
+
+    Args:
+        pages_list: Extracted pages for each organisation
+        template: "charity", "funder", "public_sector", or "startup"
+        model: Claude model to use
+        api_key: Anthropic API key (or will use env var)
+        poll_interval: Seconds to wait between batch status checks
+
+    Returns:
+        One analysis per organisation, in input order. Entries are None where
+        the batch request errored, was cancelled or expired, or the response
+        could not be parsed.
+    """
+    # Get API key
+    if api_key is None:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not found in environment")
+
+    if not pages_list:
+        return []
+
+    client = _get_client(api_key)
 
-    # Choose system prompt
-    prompt_map = {
-        "charity": CHARITY_SYSTEM_PROMPT,
-        "funder": FUNDER_SYSTEM_PROMPT,
-        "public_sector": PUBLIC_SECTOR_SYSTEM_PROMPT,
-        "startup": STARTUP_SYSTEM_PROMPT
+    batch = await client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": f"org-{idx}",
+                "params": _request_params(pages, template, model)
+            }
+            for idx, pages in enumerate(pages_list)
+        ],
+        extra_headers=_cache_headers()
+    )
+
+    while batch.processing_status != "ended":
+        await asyncio.sleep(poll_interval)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    # Results are not returned in request order, so match them on custom_id
+    analyses = [None] * len(pages_list)
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            continue
+        _record_usage(entry.result.message.usage)
+        idx = int(entry.custom_id.removeprefix("org-"))
+        # One malformed response shouldn't discard the rest of the batch
+        try:
+            analyses[idx] = _parse_response(entry.result.message.content[0].text, template)
+        except (KeyError, ValueError, IndexError, TypeError, AttributeError) as e:
+            logger.warning("Could not parse analysis for %s: %s", entry.custom_id, e)
+
+    return analyses
+
+
+def _long_cache() -> bool:
+    """
+    Whether to request the 1-hour prompt cache TTL.
+
+    Enabled with LLMSTXT_LONG_CACHE=1. Writes to the 1-hour cache are billed
+    at 2x the input price instead of 1.25x, so it only pays off for batch runs
+    where calls are more than five minutes apart.
+    """
+    return os.getenv("LLMSTXT_LONG_CACHE", "") in ("1", "true", "yes")
+
+
+def _cache_headers() -> dict[str, str]:
+    """Extra request headers for the configured prompt cache TTL."""
+    if _long_cache():
+        return {"anthropic-beta": _EXTENDED_CACHE_TTL_BETA}
+    return {}
+
+
+def _record_usage(usage) -> None:
+    """
+    Log token usage for one response at debug level.
+
+    Cache reads are billed at 0.1x the input price and cache writes at 1.25x
+    (2x with the 1-hour TTL), so the logged saving is in input-token
+    equivalents: a negative number means caching cost more than it saved
+    (writes that were never read back).
+    """
+    counts = {
+        "input_tokens": usage.input_tokens or 0,
+        "output_tokens": usage.output_tokens or 0,
+        "cache_read_input_tokens": usage.cache_read_input_tokens or 0,
+        "cache_creation_input_tokens": usage.cache_creation_input_tokens or 0,
     }
-    system_prompt = prompt_map.get(template, CHARITY_SYSTEM_PROMPT)
 
-    # Call Claude API
-    client = Anthropic(api_key=api_key)
+    logger.debug(
+        "Claude usage: input=%d cache_read=%d cache_write=%d output=%d saved=%+d",
+        counts["input_tokens"],
+        counts["cache_read_input_tokens"],
+        counts["cache_creation_input_tokens"],
+        counts["output_tokens"],
+        _cache_saving(counts),
+    )
 
-    message = client.messages.create(
-        model=model,
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[
+
+def _cache_saving(counts: dict) -> int:
+    """Input-token equivalents saved by prompt caching (negative if it cost more)."""
+    # Writes cost 1x extra on top of the input price with the 1-hour TTL
+    write_penalty = 1.0 if _long_cache() else 0.25
+    return round(
+        0.9 * counts.get("cache_read_input_tokens", 0)
+        - write_penalty * counts.get("cache_creation_input_tokens", 0)
+    )
+
+
+def _request_params(pages: list[ExtractedPage], template: str, model: str) -> dict:
+    """
+    Build the Messages API parameters for analysing one organisation.
+
+    The system prompt and the page corpus are marked as prompt-cache
+    breakpoints, so retries and re-runs against the same site within the
+    cache TTL are served from cache instead of re-processing every page.
+    """
+    cache_control = {"type": "ephemeral"}
+    if _long_cache():
+        cache_control["ttl"] = "1h"
+
+    return {
+        "model": model,
+        "max_tokens": 4096,
+        "system": [
+            {
+                "type": "text",
+                "text": _SYSTEM_PROMPTS.get(template, CHARITY_SYSTEM_PROMPT),
+                "cache_control": cache_control
+            }
+        ],
+        "messages": [
             {
                 "role": "user",
-                "content": content
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _prepare_content(pages),
+                        "cache_control": cache_control
+                    }
+                ]
             }
         ]
-    )
+    }
 
-    # Parse the response
-    response_text = message.content[0].text
 
+def _parse_response(
+    response_text: str,
+    template: str
+) -> OrganisationAnalysis | FunderAnalysis | PublicSectorAnalysis | StartupAnalysis:
+    """Parse Claude's JSON response into the dataclass for the template."""
     # Extract JSON from response (handle potential markdown code blocks)
     json_text = response_text
     if "```json" in response_text:
@@ -278,74 +491,55 @@ async def analyze_organisation(
     elif "```" in response_text:
         json_text = response_text.split("```")[1].split("```")[0].strip()
 
-    data = json.loads(json_text)
+    data = _json.loads(json_text)
 
     # Convert to appropriate dataclass
-    if template == "charity":
-        return OrganisationAnalysis(
-            name=data["name"],
-            org_type=data["org_type"],
-            registration_number=data.get("registration_number"),
-            mission=data["mission"],
-            description=data["description"],
-            geographic_area=data["geographic_area"],
-            services=data.get("services", []),
-            projects=data.get("projects"),
-            impact_metrics=data.get("impact_metrics"),
-            beneficiaries=data["beneficiaries"],
-            themes=data.get("themes", []),
-            contact=data.get("contact", {}),
-            team_info=data.get("team_info"),
-            ai_guidance=data.get("ai_guidance", [])
-        )
-    elif template == "funder":
-        return FunderAnalysis(
-            name=data["name"],
-            funder_type=data["funder_type"],
-            registration_number=data.get("registration_number"),
-            mission=data["mission"],
-            description=data["description"],
-            geographic_focus=data["geographic_focus"],
-            thematic_focus=data.get("thematic_focus", []),
-            programmes=data.get("programmes", []),
-            grant_sizes=data.get("grant_sizes", {}),
-            who_can_apply=data.get("who_can_apply", []),
-            who_cannot_apply=data.get("who_cannot_apply", []),
-            application_process=data.get("application_process", ""),
-            deadlines=data.get("deadlines"),
-            contact=data.get("contact", {}),
-            success_factors=data.get("success_factors", []),
-            ai_guidance=data.get("ai_guidance", [])
-        )
-    elif template == "public_sector":
-        return PublicSectorAnalysis(
-            name=data["name"],
-            org_type=data["org_type"],
-            governance=data.get("governance"),
-            mission=data["mission"],
-            description=data["description"],
-            area_covered=data["area_covered"],
-            services=data.get("services", []),
-            contact=data.get("contact", {}),
-            accessibility_info=data.get("accessibility_info"),
-            ai_guidance=data.get("ai_guidance", [])
-        )
-    else:  # startup
-        return StartupAnalysis(
-            name=data["name"],
-            mission=data["mission"],
-            description=data["description"],
-            product_description=data["product_description"],
-            target_customers=data["target_customers"],
-            business_model=data.get("business_model"),
-            pricing_model=data.get("pricing_model"),
-            stage=data.get("stage"),
-            funding_raised=data.get("funding_raised"),
-            traction_metrics=data.get("traction_metrics"),
-            team_highlights=data.get("team_highlights"),
-            contact=data.get("contact", {}),
-            ai_guidance=data.get("ai_guidance", [])
-        )
+    analysis_cls = _ANALYSIS_CLASSES.get(template, OrganisationAnalysis)
+    return _from_dict(analysis_cls, data)
+
+
+def _from_dict(cls: type, data: dict):
+    """
+    Build an analysis dataclass from Claude's JSON.
+
+    Missing fields get their _FIELD_DEFAULTS factory value, or None when
+    annotated as optional (``X | None``).
+
+    Raises:
+        KeyError: If a required field is missing from the response
+    """
+    defaults = _FIELD_DEFAULTS[cls]
+    values = {}
+    for f in fields(cls):
+        if f.name in data:
+            values[f.name] = data[f.name]
+        elif f.name in defaults:
+            values[f.name] = defaults[f.name]()
+        elif type(None) in typing.get_args(f.type):
+            values[f.name] = None
+        else:
+            raise KeyError(f"Claude response is missing required field {f.name!r}")
+    return cls(**values)
+
+
+def _get_client(api_key: str) -> AsyncAnthropic:
+    """Return a reusable AsyncAnthropic client for the running event loop."""
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(api_key)
+    if client is None:
+        client = loop_clients[api_key] = AsyncAnthropic(api_key=api_key)
+    return client
+
+
+@functools.cache
+def get_sync_client(api_key: str) -> Anthropic:
+    """
+    Return a shared synchronous Anthropic client for an API key.
+
+    Reusing one client keeps its connection pool alive, so later calls in the
+    same process skip the TCP and TLS handshake.
+    """
+    return Anthropic(api_key=api_key)
 
 
 def _prepare_content(pages: list[ExtractedPage]) -> str:
@@ -0,0 +1,106 @@
+"""Small on-disk JSON cache for slow-changing remote data."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+# Cached entries older than this are treated as missing
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def cache_dir() -> Path:
+    """
+    Return the cache directory.
+
+    Defaults to ~/.cache/llmstxt-social and can be overridden with the
+    LLMSTXT_CACHE_DIR environment variable.
+    """
+    override = os.getenv("LLMSTXT_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "llmstxt-social"
+
+
+def cache_enabled() -> bool:
+    """Caching can be switched off by setting LLMSTXT_NO_CACHE=1."""
+    return os.getenv("LLMSTXT_NO_CACHE", "") not in ("1", "true", "yes")
+
+
+def load(namespace: str, key: str, ttl: float = DEFAULT_TTL) -> Any | None:
+    """
+    Load a cached value.
+
+    Args:
+        namespace: Subdirectory grouping related entries
+        key: Cache key within the namespace
+        ttl: Maximum age in seconds
+
+    Returns:
+        The cached JSON value, or None if missing, expired or unreadable
+    """
+    data = _read(_path(namespace, key, ".json"), ttl)
+    if data is None:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+
+def store(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a JSON-serialisable value.
+
+    Failures to write are ignored; the cache is only an optimisation.
+    """
+    try:
+        data = json.dumps(value).encode("utf-8")
+    except (TypeError, ValueError):
+        return
+    _write(_path(namespace, key, ".json"), data)
+
+
+def load_bytes(namespace: str, key: str, ttl: float = DEFAULT_TTL) -> bytes | None:
+    """Load cached raw bytes, such as a downloaded file. See load()."""
+    return _read(_path(namespace, key, ".bin"), ttl)
+
+
+def store_bytes(namespace: str, key: str, data: bytes) -> None:
+    """Store raw bytes, such as a downloaded file. See store()."""
+    _write(_path(namespace, key, ".bin"), data)
+
+
+def _read(path: Path, ttl: float) -> bytes | None:
+    """Read a cache file if caching is enabled and it is younger than ttl."""
+    if not cache_enabled():
+        return None
+
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write(path: Path, data: bytes) -> None:
+    """Atomically write a cache file, ignoring failures."""
+    if not cache_enabled():
+        return
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _path(namespace: str, key: str, suffix: str) -> Path:
+    """Map a key to a file, hashing it so any string is a safe filename."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return cache_dir() / namespace / f"{digest}{suffix}"
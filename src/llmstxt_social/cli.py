@@ -1,22 +1,21 @@
 """Command-line interface for llmstxt-social."""
 
 import asyncio
+import logging
+import os
+from collections import Counter
 from pathlib import Path
+
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich import print as rprint
+from rich.console import Console, Group
+from rich.logging import RichHandler
 from rich.panel import Panel
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
-from rich import print as rprint
+from rich.text import Text
 
 from . import __version__
-from .crawler import crawl_site
-from .extractor import extract_content, find_charity_number
-from .analyzer import analyze_organisation
-from .generator import generate_llmstxt
-from .validator import validate_llmstxt, ValidationLevel
-from .enrichers.charity_commission import find_charity_number as find_charity_num, fetch_charity_data
-from .enrichers.threesixty_giving import fetch_360giving_data
 
 app = typer.Typer(
     name="llmstxt",
@@ -26,6 +25,14 @@ app = typer.Typer(
 console = Console()
 
 
+def _enable_debug_logging():
+    """Send llmstxt_social debug logs to the console."""
+    handler = RichHandler(console=console, show_path=False, markup=False)
+    logger = logging.getLogger("llmstxt_social")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+
+
 def version_callback(value: bool):
     """Print version and exit."""
     if value:
@@ -94,9 +101,17 @@ def generate(
         "--charity",
         help="Specify charity number directly"
     ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Show debug output, including Claude token and prompt-cache usage"
+    ),
 ):
     """Generate an llms.txt file for a website."""
 
+    if debug:
+        _enable_debug_logging()
+
     # Validate template
     if template not in ["charity", "funder", "public_sector", "startup"]:
         console.print("[red]Error:[/red] Template must be 'charity', 'funder', 'public_sector', or 'startup'")
@@ -114,7 +129,7 @@ def generate(
 
     try:
         # Run the async generation
-        result = asyncio.run(_generate_async(
+        result = asyncio.run(_closing_http_clients(_generate_async(
             url=url,
             output=output,
             template=template,
@@ -124,7 +139,7 @@ def generate(
             enrich_360=enrich_360,
             use_playwright=use_playwright,
             charity_number=charity_number
-        ))
+        )))
 
         if result:
             console.print(f"\n[green]✓[/green] Successfully generated llms.txt")
@@ -138,6 +153,16 @@ def generate(
         raise typer.Exit(1)
 
 
+async def _closing_http_clients(coro):
+    """Await a command coroutine, then close the enrichers' shared HTTP client."""
+    from .enrichers._http import aclose
+
+    try:
+        return await coro
+    finally:
+        await aclose()
+
+
 async def _generate_async(
     url: str,
     output: Path,
@@ -150,6 +175,16 @@ async def _generate_async(
     charity_number: str | None
 ) -> bool:
     """Async generation logic."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .analyzer import analyze_organisation
+    from .crawler import crawl_site
+    from .enrichers.charity_commission import fetch_charity_data
+    from .enrichers.charity_commission import find_charity_number as find_charity_num
+    from .enrichers.threesixty_giving import fetch_360giving_data
+    from .extractor import deduplicate_pages, extract_content
+    from .generator import generate_llmstxt
+    from .validator import validate_llmstxt
 
     with Progress(
         SpinnerColumn(),
@@ -198,11 +233,16 @@ async def _generate_async(
             total=len(crawl_result.pages)
         )
 
-        extracted_pages = []
-        for page in crawl_result.pages:
-            extracted = extract_content(page)
-            extracted_pages.append(extracted)
-            progress.advance(extract_task)
+        # HTML parsing is CPU-bound, so spread it across processes
+        loop = asyncio.get_running_loop()
+        workers = min(len(crawl_result.pages), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for page in crawl_result.pages:
+                future = loop.run_in_executor(pool, extract_content, page)
+                future.add_done_callback(lambda _: progress.advance(extract_task))
+                futures.append(future)
+            extracted_pages = list(await asyncio.gather(*futures))
 
         progress.update(
             extract_task,
@@ -210,13 +250,10 @@ async def _generate_async(
         )
 
         # Show page type distribution
-        page_types = {}
-        for page in extracted_pages:
-            pt = page.page_type.value
-            page_types[pt] = page_types.get(pt, 0) + 1
+        page_types = Counter(page.page_type.value for page in extracted_pages)
 
         console.print("\n[dim]Page types:[/dim]")
-        for pt, count in sorted(page_types.items(), key=lambda x: -x[1])[:5]:
+        for pt, count in page_types.most_common(5):
             console.print(f"  [dim]{pt}: {count}[/dim]")
 
         # Step 3: Find charity number if needed
@@ -252,20 +289,13 @@ async def _generate_async(
                     console.print("[dim]Skipping charity enrichment[/dim]")
 
         # Step 3a: Enrich with Charity Commission data
+        # The lookup runs in the background while Claude analyses the pages
+        charity_task = None
         if enrich and charity_number and template == "charity":
-            import os
             console.print("\n[cyan]Fetching Charity Commission data...[/cyan]")
 
             cc_api_key = os.getenv("CHARITY_COMMISSION_API_KEY")
-            charity_data = await fetch_charity_data(charity_number, cc_api_key)
-
-            if charity_data:
-                console.print(f"[green]✓[/green] Enriched with official charity data")
-                console.print(f"  [dim]Name: {charity_data.name}[/dim]")
-                if charity_data.latest_income:
-                    console.print(f"  [dim]Income: £{charity_data.latest_income:,}[/dim]")
-            else:
-                console.print("[yellow]![/yellow] Could not fetch Charity Commission data")
+            charity_task = asyncio.create_task(fetch_charity_data(charity_number, cc_api_key))
 
         # Step 3b: Enrich with 360Giving data (for funders)
         if enrich_360 and template == "funder":
@@ -290,17 +320,41 @@ async def _generate_async(
             total=None
         )
 
-        analysis = await analyze_organisation(
-            pages=extracted_pages,
-            template=template,
-            model=model
-        )
+        # Identical pages only cost tokens, so send Claude one copy of each
+        unique_pages = deduplicate_pages(extracted_pages)
+        if len(unique_pages) < len(extracted_pages):
+            console.print(
+                f"[dim]Skipping {len(extracted_pages) - len(unique_pages)} duplicate pages "
+                f"({len(unique_pages)}/{len(extracted_pages)} sent for analysis)[/dim]"
+            )
+
+        try:
+            analysis = await analyze_organisation(
+                pages=unique_pages,
+                template=template,
+                model=model
+            )
+        except BaseException:
+            if charity_task is not None:
+                charity_task.cancel()
+            raise
 
         progress.update(
             analysis_task,
             description="[green]✓ Analysis complete"
         )
 
+        if charity_task is not None:
+            charity_data = await charity_task
+
+            if charity_data:
+                console.print(f"[green]✓[/green] Enriched with official charity data")
+                console.print(f"  [dim]Name: {charity_data.name}[/dim]")
+                if charity_data.latest_income:
+                    console.print(f"  [dim]Income: £{charity_data.latest_income:,}[/dim]")
+            else:
+                console.print("[yellow]![/yellow] Could not fetch Charity Commission data")
+
         # Step 5: Generate llms.txt
         gen_task = progress.add_task(
             "[cyan]Generating llms.txt...",
@@ -341,20 +395,34 @@ async def _generate_async(
 
     # Step 7: Write to file
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(llmstxt_content, encoding='utf-8')
+    _write_text(output, llmstxt_content)
 
     return True
 
 
+# Output is encoded and written in blocks of this many characters
+_WRITE_CHUNK_SIZE = 1 << 20
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write UTF-8 text through a large buffer, encoding one block at a time."""
+    with path.open("wb", buffering=_WRITE_CHUNK_SIZE) as f:
+        for start in range(0, len(text), _WRITE_CHUNK_SIZE):
+            f.write(text[start:start + _WRITE_CHUNK_SIZE].encode("utf-8"))
+
+
 def _show_validation_results(validation):
     """Display validation results."""
-    console.print()
+    from .validator import ValidationLevel
+
+    # Build the whole report and print it in one call
+    parts = [Text()]
 
     # Summary
     if validation.valid:
-        console.print("[green]✓ Valid llms.txt file[/green]")
+        parts.append(Text.from_markup("[green]✓ Valid llms.txt file[/green]"))
     else:
-        console.print("[yellow]⚠ llms.txt has validation issues[/yellow]")
+        parts.append(Text.from_markup("[yellow]⚠ llms.txt has validation issues[/yellow]"))
 
     # Scores
     table = Table(show_header=False, box=None)
@@ -363,30 +431,40 @@ def _show_validation_results(validation):
     if validation.transparency_score:
         table.add_row("Transparency:", validation.transparency_score)
 
-    console.print(table)
+    parts.append(table)
 
     # Issues
     if validation.issues:
-        console.print(f"\n[bold]Validation issues ({len(validation.issues)}):[/bold]")
+        parts.append(Text.from_markup(
+            f"\n[bold]Validation issues ({len(validation.issues)}):[/bold]"
+        ))
 
-        for issue in validation.issues[:10]:  # Show first 10
-            level_color = {
-                ValidationLevel.ERROR: "red",
-                ValidationLevel.WARNING: "yellow",
-                ValidationLevel.INFO: "blue"
-            }[issue.level]
-
-            level_symbol = {
-                ValidationLevel.ERROR: "✗",
-                ValidationLevel.WARNING: "⚠",
-                ValidationLevel.INFO: "ℹ"
-            }[issue.level]
+        level_colors = {
+            ValidationLevel.ERROR: "red",
+            ValidationLevel.WARNING: "yellow",
+            ValidationLevel.INFO: "blue"
+        }
+        level_symbols = {
+            ValidationLevel.ERROR: "✗",
+            ValidationLevel.WARNING: "⚠",
+            ValidationLevel.INFO: "ℹ"
+        }
 
+        for issue in validation.issues[:10]:  # Show first 10
+            level_color = level_colors[issue.level]
+            level_symbol = level_symbols[issue.level]
             line_info = f" (line {issue.line})" if issue.line else ""
-            console.print(f"  [{level_color}]{level_symbol}[/{level_color}] {issue.message}{line_info}")
+            parts.append(Text.from_markup(
+                f"  [{level_color}]{level_symbol}[/{level_color}] "
+                f"{issue.message}{line_info}"
+            ))
 
         if len(validation.issues) > 10:
-            console.print(f"  [dim]... and {len(validation.issues) - 10} more[/dim]")
+            parts.append(Text.from_markup(
+                f"  [dim]... and {len(validation.issues) - 10} more[/dim]"
+            ))
+
+    console.print(Group(*parts))
 
 
 @app.command()
@@ -400,6 +478,7 @@ def validate(
     ),
 ):
     """Validate an llms.txt file against the spec."""
+    from .validator import validate_llmstxt
 
     # Validate template
     if template not in ["charity", "funder"]:
@@ -411,9 +490,11 @@ def validate(
         if path.startswith(('http://', 'https://')):
             # Fetch from URL
             import httpx
-            response = httpx.get(path, timeout=10)
-            response.raise_for_status()
-            content = response.text
+            # Request a compressed body and read it straight off the stream
+            with httpx.Client(timeout=10, headers={"Accept-Encoding": "gzip, deflate"}) as client:
+                with client.stream("GET", path) as response:
+                    response.raise_for_status()
+                    content = response.read().decode(response.encoding or "utf-8")
             console.print(f"[dim]Fetched from {path}[/dim]\n")
         else:
             # Load from file
@@ -450,6 +531,7 @@ def preview(
     ),
 ):
     """Preview what would be crawled (dry run)."""
+    from .crawler import crawl_site
 
     # Ensure URL has protocol
     if not url.startswith(('http://', 'https://')):
@@ -487,8 +569,10 @@ def preview(
 def test_api_key():
     """Test if the Anthropic API key is configured correctly."""
     import os
-    from anthropic import Anthropic
+
     from dotenv import load_dotenv
+
+    from .analyzer import get_sync_client
     
     load_dotenv()
     
@@ -526,7 +610,7 @@ def test_api_key():
     # Test API call
     try:
         console.print("[cyan]Making test API call...[/cyan]")
-        client = Anthropic(api_key=api_key)
+        client = get_sync_client(api_key)
         
         # Make a minimal API call
         message = client.messages.create(
@@ -615,24 +699,24 @@ def assess(
     try:
         if is_url:
             # Website assessment path
-            asyncio.run(_assess_from_website(
+            asyncio.run(_closing_http_clients(_assess_from_website(
                 url=source,
                 template=template,
                 output=output,
                 format=format,
                 deep_analysis=deep_analysis,
                 enrich=enrich
-            ))
+            )))
         else:
             # File assessment path
-            asyncio.run(_assess_from_file(
+            asyncio.run(_closing_http_clients(_assess_from_file(
                 file_path=source,
                 template=template,
                 output=output,
                 format=format,
                 deep_analysis=deep_analysis,
                 enrich=enrich
-            ))
+            )))
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled by user[/yellow]")
@@ -653,10 +737,16 @@ async def _assess_from_website(
     enrich: bool
 ):
     """Assess by generating llms.txt from website then analyzing it."""
+    import os
     from datetime import datetime
+
+    from .analyzer import analyze_organisation, get_sync_client
     from .assessor import LLMSTxtAssessor
-    from anthropic import Anthropic
-    import os
+    from .crawler import crawl_site
+    from .enrichers.charity_commission import fetch_charity_data
+    from .enrichers.charity_commission import find_charity_number as find_charity_num
+    from .extractor import deduplicate_pages, extract_content
+    from .generator import generate_llmstxt
 
     # Ensure URL has protocol
     if not url.startswith(('http://', 'https://')):
@@ -700,7 +790,7 @@ async def _assess_from_website(
 
         # 5. Analyze with Claude
         analysis_task = progress.add_task("Analyzing organization...", total=None)
-        analysis = await analyze_organisation(extracted_pages, template)
+        analysis = await analyze_organisation(deduplicate_pages(extracted_pages), template)
         progress.update(analysis_task, description="[green]✓[/green] Analyzed organization", completed=True)
 
         # 6. Generate llms.txt
@@ -715,7 +805,7 @@ async def _assess_from_website(
         if deep_analysis:
             api_key = os.getenv("ANTHROPIC_API_KEY")
             if api_key:
-                client = Anthropic(api_key=api_key)
+                client = get_sync_client(api_key)
             else:
                 console.print("[yellow]Warning: No API key found, skipping AI quality analysis[/yellow]")
 
@@ -744,10 +834,15 @@ async def _assess_from_file(
     enrich: bool
 ):
     """Assess an existing llms.txt file."""
+    import os
     from datetime import datetime
+
+    from .analyzer import get_sync_client
     from .assessor import LLMSTxtAssessor
-    from anthropic import Anthropic
-    import os
+    from .crawler import crawl_site
+    from .enrichers.charity_commission import fetch_charity_data
+    from .enrichers.charity_commission import find_charity_number as find_charity_num
+    from .extractor import extract_charity_number_only, extract_content
 
     # 1. Load file
     path = Path(file_path)
@@ -784,10 +879,16 @@ async def _assess_from_file(
 
                 # Get enrichment data if charity
                 if template == "charity":
-                    from .extractor import extract_content
                     enrich_task = progress.add_task("Fetching enrichment data...", total=None)
-                    extracted_pages = [extract_content(p) for p in crawl_result.pages]
-                    charity_number = find_charity_num(extracted_pages)
+                    # Only pages whose raw HTML mentions a charity number need full
+                    # extraction; find_charity_num then picks between them in the same
+                    # page priority order as generate
+                    candidate_pages = [
+                        p for p in crawl_result.pages if extract_charity_number_only(p.html)
+                    ]
+                    charity_number = find_charity_num(
+                        [extract_content(p) for p in candidate_pages]
+                    )
                     if charity_number:
                         charity_data = await fetch_charity_data(charity_number)
                     progress.update(enrich_task, description="[green]✓[/green] Fetched enrichment data", completed=True)
@@ -799,7 +900,7 @@ async def _assess_from_file(
     if deep_analysis:
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if api_key:
-            client = Anthropic(api_key=api_key)
+            client = get_sync_client(api_key)
         else:
             console.print("[yellow]Warning: No API key found, skipping AI quality analysis[/yellow]")
 
@@ -860,14 +961,14 @@ def _extract_url_from_llmstxt(content: str) -> str | None:
     """Extract website URL from llms.txt content."""
     import re
 
-    # Look for URLs in markdown links
+    # Look for the first URL in a markdown link
     url_pattern = r'\[.*?\]\((https?://[^\)]+)\)'
-    matches = re.findall(url_pattern, content)
+    match = re.search(url_pattern, content)
 
-    if matches:
+    if match:
         # Return the domain of the first URL
         from urllib.parse import urlparse
-        parsed = urlparse(matches[0])
+        parsed = urlparse(match.group(1))
         return f"{parsed.scheme}://{parsed.netloc}"
 
     return None
@@ -875,8 +976,8 @@ def _extract_url_from_llmstxt(content: str) -> str | None:
 
 def _output_assessment(assessment_result, output: Path | None, format: str, llmstxt_content: str, website_url: str | None):
     """Generate output files."""
-    from datetime import datetime
     import json
+    from datetime import datetime
 
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
 
@@ -1026,7 +1127,7 @@ def _output_assessment(assessment_result, output: Path | None, format: str, llms
         lines.append(llmstxt_content)
         lines.append("```")
 
-        md_path.write_text("\n".join(lines), encoding='utf-8')
+        _write_text(md_path, "\n".join(lines))
         console.print(f"[green]✓[/green] Markdown saved to: {md_path.absolute()}")
 
 
@@ -1 +1,29 @@
 """Enrichment modules for fetching additional data."""
+
+import importlib
+
+# Public names and the submodules that define them, imported on first
+# attribute access (PEP 562); the 360Giving enricher alone pulls in pandas.
+_LAZY = {
+    "CharityData": ".charity_commission",
+    "fetch_charity_data": ".charity_commission",
+    "fetch_charity_data_batch": ".charity_commission",
+    "GrantData": ".threesixty_giving",
+    "fetch_360giving_data": ".threesixty_giving",
+    "fetch_360giving_data_batch": ".threesixty_giving",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
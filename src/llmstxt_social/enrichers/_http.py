@@ -0,0 +1,44 @@
+"""Shared HTTP client for the enrichers."""
+
+import asyncio
+import weakref
+
+import httpx
+
+# Connection pool size shared by all enricher requests
+MAX_CONNECTIONS = 64
+
+# httpx.AsyncClient pools are bound to the event loop that first used them
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client for the running event loop.
+
+    Reusing one client keeps connections to the Charity Commission and
+    360Giving hosts alive between requests. Pass a per-request timeout for
+    slow downloads.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            timeout=15,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS
+            ),
+            headers={"User-Agent": "llmstxt-social/0.2.0 (+https://github.com/llmstxt/llmstxt-social)"}
+        )
+    return client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,15 +1,49 @@
 """Fetch charity data from the Charity Commission."""
 
+import asyncio
+import itertools
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 
-from ..extractor import ExtractedPage
+from .. import cache
+from ..extractor import ExtractedPage, _extract_charity_number
+from ._http import MAX_CONNECTIONS, get_client
 
+# Page types most likely to mention the charity number, searched first
+_PRIORITY_PAGE_TYPES = frozenset({"about", "contact", "home"})
 
-@dataclass
+# Concurrency and retry settings for Charity Commission requests
+_MAX_CONCURRENCY = MAX_CONNECTIONS
+_MAX_RETRIES = 3
+_MAX_RETRY_DELAY = 30.0
+
+# On-disk cache namespace for fetched CharityData
+_CACHE_NAMESPACE = "charity_commission"
+
+# Labels and section headings on the public register pages
+_OBJECTS_RE = re.compile("What the charity does", re.I)
+_ACTIVITIES_RE = re.compile("How the charity works", re.I)
+_TRUSTEES_RE = re.compile("Trustees", re.I)
+_CONTACT_RE = re.compile("Contact", re.I)
+_FOLLOWING_DIV = etree.XPath("following::div[1]")
+_FOLLOWING_UL = etree.XPath("following::ul[1]")
+_CONTACT_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Z|a-z]{2,}')
+_CONTACT_PHONE_RE = re.compile(r'0\d{10}|0\d{4}\s?\d{6}|0\d{3}\s?\d{3}\s?\d{4}')
+
+# Characters stripped from amounts such as "£1,234,567" before int(), including
+# the non-breaking spaces register pages use as thousands separators
+_CURRENCY_TRANS = str.maketrans('', '', '£,\t\n\r\x0b\x0c \xa0\u202f')
+
+# Name used when a lookup couldn't find the charity's name
+_UNKNOWN_NAME = "Unknown"
+
+
+@dataclass(slots=True)
 class CharityData:
     """Charity data from the Charity Commission."""
     name: str
@@ -30,7 +64,8 @@ async def fetch_charity_data(charity_number: str, api_key: str | None = None) ->
     Fetch charity data from the Charity Commission.
 
     Uses the official Charity Commission API if an API key is provided,
-    otherwise falls back to scraping the public register.
+    otherwise falls back to scraping the public register. Results that
+    found the charity are cached on disk for 24 hours.
 
     API Documentation: https://developer.charitycommission.gov.uk/
 
@@ -41,19 +76,74 @@ async def fetch_charity_data(charity_number: str, api_key: str | None = None) ->
     Returns:
         CharityData if found, None otherwise
     """
+    # Register data changes slowly, so reuse a recent lookup if we have one
+    cached = cache.load(_CACHE_NAMESPACE, charity_number)
+    if cached is not None:
+        return CharityData(**cached)
+
     # Load API key from environment if not provided
     if api_key is None:
-        import os
         api_key = os.getenv("CHARITY_COMMISSION_API_KEY")
 
     # Try API first if we have a key
+    data = None
     if api_key:
         data = await _fetch_from_api(charity_number, api_key)
-        if data:
-            return data
 
     # Fallback to scraping the public register
-    return await _fetch_from_public_register(charity_number)
+    if data is None:
+        data = await _fetch_from_public_register(charity_number)
+
+    # A placeholder from a failed lookup is not cached, so the next run retries
+    if data is not None and data.name != _UNKNOWN_NAME:
+        cache.store(_CACHE_NAMESPACE, charity_number, asdict(data))
+    return data
+
+
+async def fetch_charity_data_batch(
+    charity_numbers: list[str],
+    api_key: str | None = None
+) -> list[CharityData | None]:
+    """
+    Fetch Charity Commission data for many charities concurrently.
+
+    Requests share the enrichers' connection pool and at most 64 run at once.
+
+    Args:
+        charity_numbers: Charity registration numbers to look up
+        api_key: Optional Charity Commission API key
+
+    Returns:
+        CharityData (or None) for each charity number, in input order
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    async def fetch_one(charity_number: str) -> CharityData | None:
+        async with semaphore:
+            return await fetch_charity_data(charity_number, api_key)
+
+    return await asyncio.gather(*(fetch_one(number) for number in charity_numbers))
+
+
+async def _get_with_retry(url: str, **kwargs) -> httpx.Response:
+    """GET a URL, backing off exponentially on 429 and 5xx responses."""
+    client = get_client()
+
+    for attempt in range(_MAX_RETRIES):
+        response = await client.get(url, **kwargs)
+        if response.status_code != 429 and response.status_code < 500:
+            return response
+        await asyncio.sleep(_retry_delay(response, attempt))
+
+    return await client.get(url, **kwargs)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring a Retry-After header."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_DELAY)
+    return min(2.0 ** attempt, _MAX_RETRY_DELAY)
 
 
 async def _fetch_from_api(charity_number: str, api_key: str) -> CharityData | None:
@@ -63,22 +153,21 @@ async def _fetch_from_api(charity_number: str, api_key: str) -> CharityData | No
     API Endpoint: https://api.charitycommission.gov.uk/register/api/
     """
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            # The Charity Commission API endpoint
-            # Note: The actual API structure may vary - this is based on their documentation
-            headers = {
-                "Ocp-Apim-Subscription-Key": api_key,
-                "Content-Type": "application/json"
-            }
+        # The Charity Commission API endpoint
+        # Note: The actual API structure may vary - this is based on their documentation
+        headers = {
+            "Ocp-Apim-Subscription-Key": api_key,
+            "Content-Type": "application/json"
+        }
 
-            # Try to get charity details
-            url = f"https://api.charitycommission.gov.uk/register/api/allcharitydetails/{charity_number}/0"
+        # Try to get charity details
+        url = f"https://api.charitycommission.gov.uk/register/api/allcharitydetails/{charity_number}/0"
 
-            response = await client.get(url, headers=headers)
+        response = await _get_with_retry(url, headers=headers)
 
-            if response.status_code == 200:
-                data = response.json()
-                return _parse_api_response(data, charity_number)
+        if response.status_code == 200:
+            data = response.json()
+            return _parse_api_response(data, charity_number)
 
     except Exception:
         # Fall back to scraping if API fails
@@ -96,7 +185,7 @@ def _parse_api_response(data: dict, charity_number: str) -> CharityData | None:
     """
     try:
         # Extract charity name
-        name = data.get("charity_name", "Unknown")
+        name = data.get("charity_name", _UNKNOWN_NAME)
 
         # Extract status
         status = data.get("reg_status", "Unknown")
@@ -196,169 +285,216 @@ async def _fetch_from_public_register(charity_number: str) -> CharityData | None
     Uses the Find and Update service which is more machine-readable.
     """
     try:
-        async with httpx.AsyncClient(
-            timeout=15,
-            follow_redirects=True,
-            headers={"User-Agent": "llmstxt-social/0.2.0 (+https://github.com/llmstxt/llmstxt-social)"}
-        ) as client:
-            # Try the Find and Update service first (has better structured data)
-            find_update_url = f"https://beta.charitycommission.gov.uk/charity-details/?regid={charity_number}&subid=0"
+        # Try the Find and Update service first (has better structured data)
+        find_update_url = f"https://beta.charitycommission.gov.uk/charity-details/?regid={charity_number}&subid=0"
+
+        response = await _get_with_retry(find_update_url)
 
-            response = await client.get(find_update_url)
+        if response.status_code != 200:
+            # Fallback to main register
+            url = f"https://register-of-charities.charitycommission.gov.uk/charity-search/-/charity-details/{charity_number}"
+            response = await _get_with_retry(url)
 
             if response.status_code != 200:
-                # Fallback to main register
-                url = f"https://register-of-charities.charitycommission.gov.uk/charity-search/-/charity-details/{charity_number}"
-                response = await client.get(url)
+                return None
 
-                if response.status_code != 200:
-                    return None
+        return _parse_register_page(response.text, charity_number)
 
-            soup = BeautifulSoup(response.text, "lxml")
+    except Exception:
+        return None
 
-            # Extract charity name - try multiple selectors
-            name = "Unknown"
 
-            # Try different selectors that work on different CC pages
-            name_selectors = [
-                ("h1", {"class": "charity-heading"}),
-                ("h1", {}),  # Any h1
-                ("h2", {"class": "charity-name"}),
-                ("div", {"class": "charity-name"}),
-            ]
+def _parse_register_page(html: str, charity_number: str) -> CharityData:
+    """Parse a Charity Commission register page into CharityData."""
+    tree = lxml.html.fromstring(html)
+    etree.strip_elements(tree, "script", "style", with_tail=False)
+
+    # Collect every element the fields below need in a single traversal,
+    # rather than re-walking the whole tree once per field.
+    elements_by_tag = {"h1": [], "h2": [], "h3": [], "th": []}
+    main = None
+    content = None
+    status_element = None
+    charity_name_elements = {}
+
+    for element in tree.iter(etree.Element):
+        tag = element.tag
+        classes = (element.get("class") or "").split()
+
+        if tag in elements_by_tag:
+            elements_by_tag[tag].append(element)
+        if tag == "main" and main is None:
+            main = element
+        if content is None and element.get("id") == "content":
+            content = element
+        if status_element is None and "charity-status" in classes:
+            status_element = element
+        if tag in ("h2", "div") and "charity-name" in classes:
+            charity_name_elements.setdefault(tag, element)
+
+    # Extract charity name - try multiple selectors
+    name = _UNKNOWN_NAME
+
+    # First h1 in main content
+    main = main if main is not None else content
+    main_h1 = next(
+        (h1 for h1 in elements_by_tag["h1"] if main is None or main in h1.iterancestors()),
+        None
+    )
+
+    # Try different selectors that work on different CC pages
+    name_candidates = [
+        next(
+            (
+                h1 for h1 in elements_by_tag["h1"]
+                if "charity-heading" in (h1.get("class") or "").split()
+            ),
+            None
+        ),
+        main_h1,
+        charity_name_elements.get("h2"),
+        charity_name_elements.get("div"),
+    ]
 
-            for tag, attrs in name_selectors:
-                if attrs:
-                    name_element = soup.find(tag, **attrs)
-                else:
-                    # Find first h1 in main content
-                    main = soup.find("main") or soup.find(id="content") or soup
-                    name_element = main.find(tag)
-
-                if name_element:
-                    name_text = name_element.get_text(strip=True)
-
-                    # Clean up the name - remove page titles and other noise
-                    # Remove common prefixes
-                    cleanup_patterns = [
-                        "Register of Charities - The Charity Commission",
-                        "Charity Commission",
-                        "Register of Charities",
-                    ]
-
-                    for pattern in cleanup_patterns:
-                        if pattern in name_text:
-                            name_text = name_text.replace(pattern, "").strip()
-
-                    # Filter out generic text
-                    if name_text and name_text not in ["Search", "Charity Details", "Register", ""]:
-                        name = name_text
-                        break
-
-            # Extract registration status
-            status = "Registered"
-            status_element = soup.select_one(".charity-status")
-            if status_element:
-                status = status_element.get_text(strip=True)
-
-            # Extract registration date
-            date_registered = None
-            date_element = soup.find("th", string=re.compile("Registered"))
-            if date_element:
-                date_td = date_element.find_next_sibling("td")
-                if date_td:
-                    date_registered = date_td.get_text(strip=True)
-
-            # Extract financial information
-            latest_income = None
-            latest_expenditure = None
-
-            income_element = soup.find("th", string=re.compile("Income", re.I))
-            if income_element:
-                income_td = income_element.find_next_sibling("td")
-                if income_td:
-                    income_text = income_td.get_text(strip=True)
-                    # Parse income (e.g., "£123,456")
-                    income_clean = re.sub(r'[£,\s]', '', income_text)
-                    try:
-                        latest_income = int(income_clean)
-                    except ValueError:
-                        pass
-
-            spending_element = soup.find("th", string=re.compile("Spending", re.I))
-            if spending_element:
-                spending_td = spending_element.find_next_sibling("td")
-                if spending_td:
-                    spending_text = spending_td.get_text(strip=True)
-                    spending_clean = re.sub(r'[£,\s]', '', spending_text)
-                    try:
-                        latest_expenditure = int(spending_clean)
-                    except ValueError:
-                        pass
-
-            # Extract charitable objects (what the charity does)
-            charitable_objects = None
-            objects_section = soup.find("h3", string=re.compile("What the charity does", re.I))
-            if objects_section:
-                objects_div = objects_section.find_next("div")
-                if objects_div:
-                    charitable_objects = objects_div.get_text(separator=" ", strip=True)[:500]
-
-            # Extract activities
-            activities = None
-            activities_section = soup.find("h3", string=re.compile("How the charity works", re.I))
-            if activities_section:
-                activities_div = activities_section.find_next("div")
-                if activities_div:
-                    activities = activities_div.get_text(separator=" ", strip=True)[:500]
-
-            # Extract trustees (would need to visit a separate page or section)
-            trustees = []
-            trustees_section = soup.find("h2", string=re.compile("Trustees", re.I))
-            if trustees_section:
-                trustee_list = trustees_section.find_next("ul")
-                if trustee_list:
-                    for li in trustee_list.find_all("li")[:10]:
-                        trustee_name = li.get_text(strip=True)
-                        if trustee_name:
-                            trustees.append(trustee_name)
-
-            # Extract contact information
-            contact = {}
-
-            # Look for contact information in various sections
-            contact_section = soup.find("h3", string=re.compile("Contact", re.I))
-            if contact_section:
-                contact_div = contact_section.find_next("div")
-                if contact_div:
-                    contact_text = contact_div.get_text()
-
-                    # Extract email
-                    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Z|a-z]{2,}', contact_text)
-                    if email_match:
-                        contact["email"] = email_match.group(0)
-
-                    # Extract phone
-                    phone_match = re.search(r'0\d{10}|0\d{4}\s?\d{6}|0\d{3}\s?\d{3}\s?\d{4}', contact_text)
-                    if phone_match:
-                        contact["phone"] = phone_match.group(0)
-
-            return CharityData(
-                name=name,
-                number=charity_number,
-                status=status,
-                date_registered=date_registered,
-                date_removed=None,
-                latest_income=latest_income,
-                latest_expenditure=latest_expenditure,
-                charitable_objects=charitable_objects,
-                activities=activities,
-                trustees=trustees,
-                contact=contact
-            )
+    for name_element in name_candidates:
+        if name_element is not None:
+            name_text = _text(name_element)
 
-    except Exception:
-        return None
+            # Clean up the name - remove page titles and other noise
+            # Remove common prefixes
+            cleanup_patterns = [
+                "Register of Charities - The Charity Commission",
+                "Charity Commission",
+                "Register of Charities",
+            ]
+
+            for pattern in cleanup_patterns:
+                if pattern in name_text:
+                    name_text = name_text.replace(pattern, "").strip()
+
+            # Filter out generic text
+            if name_text and name_text not in ["Search", "Charity Details", "Register", ""]:
+                name = name_text
+                break
+
+    # Extract registration status
+    status = "Registered"
+    if status_element is not None:
+        status = _text(status_element)
+
+    # The register shows its key facts as a table of th labels and td values,
+    # so read every label once and look fields up by name
+    labels = {}
+    for th in elements_by_tag["th"]:
+        td = next(th.itersiblings("td"), None)
+        if td is not None:
+            labels.setdefault(_text(th).lower(), _text(td))
+
+    def label_value(label: str) -> str | None:
+        return next((value for key, value in labels.items() if label in key), None)
+
+    # Extract registration date
+    date_registered = label_value("registered")
+
+    # Extract financial information
+    latest_income = None
+    latest_expenditure = None
+
+    income_text = label_value("income")
+    if income_text is not None:
+        # Parse income (e.g., "£123,456")
+        try:
+            latest_income = int(income_text.translate(_CURRENCY_TRANS))
+        except ValueError:
+            pass
+
+    spending_text = label_value("spending")
+    if spending_text is not None:
+        try:
+            latest_expenditure = int(spending_text.translate(_CURRENCY_TRANS))
+        except ValueError:
+            pass
+
+    # Extract charitable objects (what the charity does)
+    charitable_objects = None
+    objects_section = _find_by_string(elements_by_tag["h3"], _OBJECTS_RE)
+    if objects_section is not None:
+        objects_div = _first(_FOLLOWING_DIV(objects_section))
+        if objects_div is not None:
+            charitable_objects = _text(objects_div, " ")[:500]
+
+    # Extract activities
+    activities = None
+    activities_section = _find_by_string(elements_by_tag["h3"], _ACTIVITIES_RE)
+    if activities_section is not None:
+        activities_div = _first(_FOLLOWING_DIV(activities_section))
+        if activities_div is not None:
+            activities = _text(activities_div, " ")[:500]
+
+    # Extract trustees (would need to visit a separate page or section)
+    trustees = []
+    trustees_section = _find_by_string(elements_by_tag["h2"], _TRUSTEES_RE)
+    if trustees_section is not None:
+        trustee_list = _first(_FOLLOWING_UL(trustees_section))
+        if trustee_list is not None:
+            for li in list(trustee_list.iter("li"))[:10]:
+                trustee_name = _text(li)
+                if trustee_name:
+                    trustees.append(trustee_name)
+
+    # Extract contact information
+    contact = {}
+
+    # Look for contact information in various sections
+    contact_section = _find_by_string(elements_by_tag["h3"], _CONTACT_RE)
+    if contact_section is not None:
+        contact_div = _first(_FOLLOWING_DIV(contact_section))
+        if contact_div is not None:
+            contact_text = contact_div.text_content()
+
+            # Extract email
+            email_match = _CONTACT_EMAIL_RE.search(contact_text)
+            if email_match:
+                contact["email"] = email_match.group(0)
+
+            # Extract phone
+            phone_match = _CONTACT_PHONE_RE.search(contact_text)
+            if phone_match:
+                contact["phone"] = phone_match.group(0)
+
+    return CharityData(
+        name=name,
+        number=charity_number,
+        status=status,
+        date_registered=date_registered,
+        date_removed=None,
+        latest_income=latest_income,
+        latest_expenditure=latest_expenditure,
+        charitable_objects=charitable_objects,
+        activities=activities,
+        trustees=trustees,
+        contact=contact
+    )
+
+
+def _text(element: HtmlElement, separator: str = "") -> str:
+    """Join an element's stripped text fragments (like BeautifulSoup's get_text(strip=True))."""
+    return separator.join(
+        fragment.strip() for fragment in element.itertext() if fragment.strip()
+    )
+
+
+def _first(elements: list[HtmlElement]) -> HtmlElement | None:
+    """Return the first element of an XPath result, if any."""
+    return elements[0] if elements else None
+
+
+def _find_by_string(elements: list[HtmlElement], pattern: re.Pattern) -> HtmlElement | None:
+    """Return the first element whose own text, with no child elements, matches the pattern."""
+    return next(
+        (el for el in elements if len(el) == 0 and el.text and pattern.search(el.text)),
+        None
+    )
 
 
 def find_charity_number(pages: list[ExtractedPage]) -> str | None:
@@ -376,36 +512,29 @@ def find_charity_number(pages: list[ExtractedPage]) -> str | None:
     Returns:
         Charity number if found, otherwise None
     """
-    # First check if any page already has charity_number extracted
-    for page in pages:
+    # Search key pages first (footer, about, contact), then the rest, stopping
+    # at the first page that already has a number extracted or whose text
+    # contains one
+    priority_pages = [p for p in pages if p.page_type.value in _PRIORITY_PAGE_TYPES]
+
+    # Identity, not dataclass equality, decides membership; chaining avoids
+    # building a merged list when an early page matches
+    priority_ids = {id(p) for p in priority_pages}
+    all_pages_to_search = itertools.chain(
+        priority_pages, (p for p in pages if id(p) not in priority_ids)
+    )
+
+    for page in all_pages_to_search:
         if page.charity_number:
             return page.charity_number
 
-    # Common patterns for charity numbers in text
-    patterns = [
-        r'registered charity\s+(?:number|no\.?|#)?\s*:?\s*(\d{6,7})',
-        r'charity\s+(?:number|no\.?|registration|reg\.?)?\s*:?\s*(\d{6,7})',
-        r'charity\s+commission\s+(?:number|no\.?)?\s*:?\s*(\d{6,7})',
-        r'(?:england\s+(?:and|&)\s+wales|e&w)\s+(?:charity\s+)?(?:number|no\.?)?\s*:?\s*(\d{6,7})',
-    ]
-
-    # Search in key pages first (footer, about, contact)
-    priority_pages = [
-        p for p in pages
-        if p.page_type.value in ['about', 'contact', 'home']
-    ]
+        # extract_content already searched the whole page, which contains
+        # body_text, with the same patterns and found nothing
+        if page.charity_scanned or not page.body_text:
+            continue
 
-    all_pages_to_search = priority_pages + [p for p in pages if p not in priority_pages]
-
-    for page in all_pages_to_search:
-        text_lower = page.body_text.lower()
-
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                charity_num = match.group(1)
-                # Validate it's a reasonable length
-                if 6 <= len(charity_num) <= 7:
-                    return charity_num
+        charity_number = _extract_charity_number(page.body_text)
+        if charity_number:
+            return charity_number
 
     return None
@@ -1,15 +1,72 @@
 """Fetch grant data from 360Giving."""
 
+import asyncio
 import re
+import weakref
+from collections import Counter
 from dataclasses import dataclass
-import httpx
 import pandas as pd
-from io import StringIO
+from io import BytesIO
 
+from .. import cache
 from ..extractor import ExtractedPage
-
-
-@dataclass
+from ._http import get_client
+
+# 360Giving publisher registry
+_REGISTRY_URL = "https://data.threesixtygiving.org/data.json"
+
+# On-disk cache namespace for the registry and dataset downloads
+_CACHE_NAMESPACE = "360giving"
+
+# Maximum number of funders fetched at once by fetch_360giving_data_batch
+_MAX_CONCURRENCY = 10
+
+# Common words ignored when comparing funder names
+_NAME_STOPWORDS = frozenset({"foundation", "trust", "charity", "fund", "the", "limited", "ltd"})
+
+# The parsed registry, loaded once per process (see _load_registry)
+_registry: "_Registry | None" = None
+_registry_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+_GIVING_RE = re.compile("giving", re.IGNORECASE)
+
+# Common 360Giving field names and the names used in the analysis
+_COLUMN_MAP = {
+    'Amount Awarded': 'amount',
+    'Award Date': 'award_date',
+    'Recipient Org:Name': 'recipient',
+    'Beneficiary Location:Name': 'location',
+    'Grant Programme:Title': 'programme',
+    'Description': 'description'
+}
+
+# Common charity/funding themes to look for in grant descriptions
+_THEME_KEYWORDS = {
+    'youth': ['youth', 'young people', 'children', 'schools'],
+    'health': ['health', 'wellbeing', 'mental health', 'medical'],
+    'education': ['education', 'learning', 'training', 'skills'],
+    'environment': ['environment', 'climate', 'nature', 'conservation'],
+    'community': ['community', 'neighbourhood', 'local'],
+    'arts': ['arts', 'culture', 'music', 'theatre'],
+    'poverty': ['poverty', 'deprivation', 'disadvantaged'],
+    'disability': ['disability', 'disabled', 'accessibility'],
+    'elderly': ['elderly', 'older people', 'seniors'],
+    'homelessness': ['homeless', 'housing', 'shelter'],
+}
+
+# Zero-width lookahead, so overlapping keywords ("health" inside "mental
+# health") are each counted, matching str.count per keyword. No keyword is a
+# prefix of another, so each position matches at most one keyword.
+_THEME_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(keyword) for keywords in _THEME_KEYWORDS.values() for keyword in keywords
+    ) + '))'
+)
+
+
+@dataclass(slots=True)
 class GrantData:
     """360Giving grant data for a funder."""
     funder_name: str
@@ -54,6 +111,39 @@ async def fetch_360giving_data(
     return await _fetch_and_analyze_grants(registry_data)
 
 
+async def fetch_360giving_data_batch(
+    funders: list[tuple[str, str | None]]
+) -> list[GrantData | None]:
+    """
+    Fetch 360Giving grant data for many funders concurrently.
+
+    The registry is loaded once and shared; at most 10 funders' datasets are
+    downloaded at once.
+
+    Args:
+        funders: (funder name, optional charity number) pairs
+
+    Returns:
+        GrantData (or None) for each funder, in input order
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    async def fetch_one(funder_name: str, charity_number: str | None) -> GrantData | None:
+        async with semaphore:
+            return await fetch_360giving_data(funder_name, charity_number)
+
+    return await asyncio.gather(*(fetch_one(name, number) for name, number in funders))
+
+
+@dataclass
+class _Registry:
+    """The 360Giving publisher registry, indexed for lookups."""
+    publishers: list[dict]
+    names: list[str]  # Lowercased publisher names, parallel to publishers
+    name_tokens: list[frozenset[str]]  # See _name_tokens, parallel to publishers
+    by_charity_number: dict[str, dict]
+
+
 async def _find_funder_in_registry(
     funder_name: str,
     charity_number: str | None
@@ -62,55 +152,106 @@ async def _find_funder_in_registry(
     Find a funder in the 360Giving publisher registry.
     """
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            # The 360Giving registry API
-            registry_url = "https://data.threesixtygiving.org/data.json"
+        registry = await _load_registry()
+        if registry is None:
+            return None
 
-            response = await client.get(registry_url)
+        return _search_registry(registry, funder_name, charity_number)
 
-            if response.status_code != 200:
-                return None
+    except Exception:
+        return None
 
-            registry = response.json()
 
-            # Search for the funder by name or charity number
-            funder_name_lower = funder_name.lower()
+async def _load_registry() -> _Registry | None:
+    """
+    Load the publisher registry once per process.
 
-            for publisher in registry.get("publishers", []):
-                pub_name = publisher.get("name", "").lower()
+    The registry changes rarely, so a recent copy is also reused from the
+    on-disk cache. A lock stops concurrent lookups fetching it twice.
+    """
+    global _registry
 
-                # Check if names match (fuzzy matching)
-                if (funder_name_lower in pub_name or
-                    pub_name in funder_name_lower or
-                    _similar_names(funder_name_lower, pub_name)):
+    if _registry is not None:
+        return _registry
 
-                    # If we have charity number, verify it matches
-                    if charity_number:
-                        pub_charity_num = publisher.get("charity_number", "")
-                        if pub_charity_num and pub_charity_num != charity_number:
-                            continue
+    lock = _registry_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+    async with lock:
+        if _registry is None:
+            data = cache.load(_CACHE_NAMESPACE, _REGISTRY_URL)
 
-                    return publisher
+            if data is None:
+                response = await get_client().get(_REGISTRY_URL)
 
-    except Exception:
-        pass
+                if response.status_code != 200:
+                    return None
+
+                data = response.json()
+                cache.store(_CACHE_NAMESPACE, _REGISTRY_URL, data)
+
+            publishers = data.get("publishers", [])
+            by_charity_number = {}
+            for publisher in publishers:
+                pub_charity_num = publisher.get("charity_number")
+                if pub_charity_num:
+                    by_charity_number.setdefault(pub_charity_num, publisher)
+
+            names = [publisher.get("name", "").lower() for publisher in publishers]
+            _registry = _Registry(
+                publishers=publishers,
+                names=names,
+                name_tokens=[_name_tokens(name) for name in names],
+                by_charity_number=by_charity_number
+            )
+
+    return _registry
+
+
+def _search_registry(
+    registry: _Registry,
+    funder_name: str,
+    charity_number: str | None
+) -> dict | None:
+    """Find a publisher by charity number, or else by (fuzzy) name."""
+    # An exact charity number match is the most reliable
+    if charity_number and charity_number in registry.by_charity_number:
+        return registry.by_charity_number[charity_number]
+
+    # Search for the funder by name
+    funder_name_lower = funder_name.lower()
+
+    funder_tokens = _name_tokens(funder_name_lower)
+
+    for publisher, pub_name, pub_tokens in zip(
+        registry.publishers, registry.names, registry.name_tokens, strict=True
+    ):
+        # Check if names match (fuzzy matching)
+        if (funder_name_lower in pub_name or
+            pub_name in funder_name_lower or
+            _similar_tokens(funder_tokens, pub_tokens)):
+
+            # If we have charity number, verify it matches
+            if charity_number:
+                pub_charity_num = publisher.get("charity_number", "")
+                if pub_charity_num and pub_charity_num != charity_number:
+                    continue
+
+            return publisher
 
     return None
 
 
 def _similar_names(name1: str, name2: str) -> bool:
     """Check if two funder names are similar (basic fuzzy matching)."""
-    # Remove common words
-    stopwords = ["foundation", "trust", "charity", "fund", "the", "limited", "ltd"]
+    return _similar_tokens(_name_tokens(name1), _name_tokens(name2))
+
 
-    words1 = set(name1.split())
-    words2 = set(name2.split())
+def _name_tokens(name: str) -> frozenset[str]:
+    """Split a lowercased funder name into words, without common words."""
+    return frozenset(name.split()) - _NAME_STOPWORDS
 
-    # Remove stopwords
-    words1 = {w for w in words1 if w not in stopwords}
-    words2 = {w for w in words2 if w not in stopwords}
 
-    # Check if significant overlap
+def _similar_tokens(words1: frozenset[str], words2: frozenset[str]) -> bool:
+    """Check if two sets of name words overlap significantly."""
     if not words1 or not words2:
         return False
 
@@ -137,21 +278,34 @@ async def _fetch_and_analyze_grants(publisher: dict) -> GrantData | None:
         if not download_url:
             return None
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(download_url)
-
-            if response.status_code != 200:
-                return None
+        if not download_url.endswith(('.csv', '.json')):
+            return None
 
-            # Parse the data (usually CSV or JSON)
-            if download_url.endswith('.csv'):
-                df = pd.read_csv(StringIO(response.text))
-            elif download_url.endswith('.json'):
-                df = pd.read_json(StringIO(response.text))
-            else:
-                return None
+        # Datasets are republished at most daily, so reuse a cached download
+        data = cache.load_bytes(_CACHE_NAMESPACE, download_url)
+        if data is not None:
+            buffer = BytesIO(data)
+        else:
+            # Stream the raw bytes into a buffer and let pandas decode them,
+            # rather than holding the body, its decoded text and a copy at once
+            buffer = BytesIO()
+            async with get_client().stream("GET", download_url, timeout=30) as response:
+                if response.status_code != 200:
+                    return None
+
+                async for chunk in response.aiter_bytes():
+                    buffer.write(chunk)
+            cache.store_bytes(_CACHE_NAMESPACE, download_url, buffer.getvalue())
+        buffer.seek(0)
+
+        # Parse the data (usually CSV or JSON)
+        if download_url.endswith('.csv'):
+            # Only parse the columns the analysis uses
+            df = pd.read_csv(buffer, usecols=lambda column: column in _COLUMN_MAP)
+        else:
+            df = pd.read_json(buffer)
 
-            return _analyze_grants_dataframe(df, publisher.get("name", "Unknown"))
+        return _analyze_grants_dataframe(df, publisher.get("name", "Unknown"))
 
     except Exception:
         return None
@@ -160,28 +314,23 @@ async def _fetch_and_analyze_grants(publisher: dict) -> GrantData | None:
 def _analyze_grants_dataframe(df: pd.DataFrame, funder_name: str) -> GrantData | None:
     """Analyze a 360Giving grants dataframe."""
     try:
-        # Standardize column names (360Giving uses specific field names)
-        # Map common 360Giving field names
-        column_map = {
-            'Amount Awarded': 'amount',
-            'Award Date': 'award_date',
-            'Recipient Org:Name': 'recipient',
-            'Beneficiary Location:Name': 'location',
-            'Grant Programme:Title': 'programme',
-            'Description': 'description'
-        }
-
-        # Rename columns if they exist
-        for old_col, new_col in column_map.items():
-            if old_col in df.columns:
-                df = df.rename(columns={old_col: new_col})
+        # Standardize column names (360Giving uses specific field names).
+        # Renaming returns a copy, so the caller's dataframe is never modified
+        df = df.rename(columns={
+            old_col: new_col for old_col, new_col in _COLUMN_MAP.items() if old_col in df.columns
+        })
 
         # Calculate statistics
         total_grants = len(df)
 
-        # Amount analysis
+        # Coerce amounts once; reused for the totals and per-year stats
+        amount_values = None
         if 'amount' in df.columns:
-            amounts = pd.to_numeric(df['amount'], errors='coerce').dropna()
+            amount_values = pd.to_numeric(df['amount'], errors='coerce')
+
+        # Amount analysis
+        if amount_values is not None:
+            amounts = amount_values.dropna()
 
             total_amount = amounts.sum()
             average_grant = amounts.mean()
@@ -206,39 +355,39 @@ def _analyze_grants_dataframe(df: pd.DataFrame, funder_name: str) -> GrantData |
         # Sample recipients
         sample_recipients = []
         if 'recipient' in df.columns:
-            recipient_cols = ['recipient']
+            sample_df = df.head(10)
+            sample_recipients = [{'name': name} for name in sample_df['recipient'].tolist()]
+
+            # Fill each optional field column by column rather than building
+            # a Series per row
             if 'amount' in df.columns:
-                recipient_cols.append('amount')
+                amounts = sample_df['amount'].astype(float).tolist()
+                for recipient, amount in zip(sample_recipients, amounts, strict=True):
+                    recipient['amount'] = amount
             if 'award_date' in df.columns:
-                recipient_cols.append('award_date')
-
-            sample_df = df[recipient_cols].head(10)
+                dates = sample_df['award_date'].tolist()
+                for recipient, date in zip(sample_recipients, dates, strict=True):
+                    recipient['date'] = str(date)
 
-            for _, row in sample_df.iterrows():
-                recipient = {'name': row.get('recipient', 'Unknown')}
-                if 'amount' in row:
-                    recipient['amount'] = float(row['amount'])
-                if 'award_date' in row:
-                    recipient['date'] = str(row['award_date'])
-                sample_recipients.append(recipient)
+        # Parse award dates once; reused for per-year stats and data quality
+        award_dates = None
+        if 'award_date' in df.columns:
+            award_dates = _parse_award_dates(df['award_date'])
 
         # Grants over time
         grants_over_time = {}
-        if 'award_date' in df.columns:
-            df['year'] = pd.to_datetime(df['award_date'], errors='coerce').dt.year
-            year_stats = df.groupby('year').agg({
-                'amount': ['count', 'sum']
-            }).dropna()
-
-            for year, row in year_stats.iterrows():
-                if pd.notna(year):
-                    grants_over_time[int(year)] = {
-                        'count': int(row[('amount', 'count')]),
-                        'total': float(row[('amount', 'sum')])
-                    }
+        if award_dates is not None and amount_values is not None:
+            years = award_dates.dt.year
+            year_stats = amount_values.groupby(years).agg(count='count', total='sum')
+
+            for year, count, total in year_stats.itertuples(name=None):
+                grants_over_time[int(year)] = {
+                    'count': int(count),
+                    'total': float(total)
+                }
 
         # Data quality assessment
-        data_quality_score = _assess_data_quality(df)
+        data_quality_score = _assess_data_quality(df, award_dates)
 
         return GrantData(
             funder_name=funder_name,
@@ -271,28 +420,17 @@ def _extract_themes(df: pd.DataFrame) -> list[str]:
     if not text_columns:
         return themes
 
-    # Combine all text
+    # Combine all text, one column at a time
     all_text = ' '.join(
-        df[text_columns].fillna('').astype(str).values.flatten()
+        df[column].fillna('').astype(str).str.cat(sep=' ') for column in text_columns
     ).lower()
 
-    # Common charity/funding themes to look for
-    theme_keywords = {
-        'youth': ['youth', 'young people', 'children', 'schools'],
-        'health': ['health', 'wellbeing', 'mental health', 'medical'],
-        'education': ['education', 'learning', 'training', 'skills'],
-        'environment': ['environment', 'climate', 'nature', 'conservation'],
-        'community': ['community', 'neighbourhood', 'local'],
-        'arts': ['arts', 'culture', 'music', 'theatre'],
-        'poverty': ['poverty', 'deprivation', 'disadvantaged'],
-        'disability': ['disability', 'disabled', 'accessibility'],
-        'elderly': ['elderly', 'older people', 'seniors'],
-        'homelessness': ['homeless', 'housing', 'shelter'],
-    }
+    # Count every keyword occurrence in one pass over the text
+    keyword_counts = Counter(match.group(1) for match in _THEME_KEYWORD_RE.finditer(all_text))
 
     theme_counts = {}
-    for theme, keywords in theme_keywords.items():
-        count = sum(all_text.count(keyword) for keyword in keywords)
+    for theme, keywords in _THEME_KEYWORDS.items():
+        count = sum(keyword_counts[keyword] for keyword in keywords)
         if count > 0:
             theme_counts[theme] = count
 
@@ -301,8 +439,27 @@ def _extract_themes(df: pd.DataFrame) -> list[str]:
     return [theme for theme, _ in sorted_themes[:5]]
 
 
-def _assess_data_quality(df: pd.DataFrame) -> str:
-    """Assess the quality of the 360Giving data."""
+def _parse_award_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse 360Giving award dates as UTC timestamps.
+
+    Dates are ISO 8601, but publishers mix plain dates, datetimes and UTC
+    offsets; an explicit format parses them all in one vectorised pass instead
+    of inferring the format from the first value and dropping the rest.
+    Unparseable dates become NaT.
+    """
+    return pd.to_datetime(dates, errors='coerce', format='ISO8601', utc=True)
+
+
+def _assess_data_quality(df: pd.DataFrame, award_dates: pd.Series | None = None) -> str:
+    """
+    Assess the quality of the 360Giving data.
+
+    Args:
+        df: Grants dataframe with standardised column names
+        award_dates: The award_date column already parsed by _parse_award_dates;
+            parsed here if not given
+    """
     # Check completeness of key fields
     key_fields = ['amount', 'award_date', 'recipient', 'description']
 
@@ -311,10 +468,12 @@ def _assess_data_quality(df: pd.DataFrame) -> str:
 
     # Check data freshness (most recent grant)
     is_recent = False
-    if 'award_date' in df.columns:
-        latest_date = pd.to_datetime(df['award_date'], errors='coerce').max()
+    if award_dates is None and 'award_date' in df.columns:
+        award_dates = _parse_award_dates(df['award_date'])
+    if award_dates is not None:
+        latest_date = award_dates.max()
         if pd.notna(latest_date):
-            years_ago = (pd.Timestamp.now() - latest_date).days / 365
+            years_ago = (pd.Timestamp.now(tz='UTC') - latest_date).days / 365
             is_recent = years_ago < 2
 
     # Score
@@ -335,7 +494,7 @@ def find_funder_identifier(pages: list[ExtractedPage]) -> tuple[str | None, str
     """
     # Look for 360Giving badge or mention
     for page in pages:
-        if '360' in page.body_text and 'giving' in page.body_text.lower():
+        if '360' in page.body_text and _GIVING_RE.search(page.body_text):
             # This funder likely publishes 360Giving data
             pass
 
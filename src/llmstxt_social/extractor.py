@@ -1,13 +1,81 @@
 """Content extraction from HTML pages."""
 
+import hashlib
+import html as htmllib
 import re
 from dataclasses import dataclass
 from enum import Enum
-from bs4 import BeautifulSoup, Tag
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 
 from .crawler import Page
 
 
+# Patterns for charity numbers (UK charities are 6-7 digits), matched
+# case-insensitively. These handle common variations including periods, colons,
+# and spaces. They are folded into one alternation so the text is scanned once;
+# each branch has its own capture group and earlier branches win ties.
+_CHARITY_NUMBER_RE = re.compile('|'.join((
+    # "Registered Charity No. 1094112" or "Registered Charity Number 1094112"
+    r'registered\s+charity\s+(?:number|no\.?|num\.?|#)?\s*:?\s*(\d{6,7})',
+    # "Charity No: 1094112" or "Charity Number: 1094112"
+    r'charity\s+(?:number|no\.?|num\.?|#|registration|reg\.?)\s*:?\s*(\d{6,7})',
+    # "Charity Commission No. 1094112" or "Charity Commission registration 1094112"
+    r'charity\s+commission\s+(?:number|no\.?|#|registration|reg\.?)?\s*:?\s*(\d{6,7})',
+    # "England and Wales 1094112", "E&W 1094112" or "England and Wales registration 1094112"
+    r'(?:england\s+(?:and|&)\s+wales|e\s*&\s*w)\s+(?:charity\s+)?'
+    r'(?:number|no\.?|#|registration|reg\.?)?\s*:?\s*(\d{6,7})',
+    # "Reg. Charity 1094112"
+    r'reg\.?\s+charity\s*:?\s*(\d{6,7})',
+    # Fallback: Just "Charity: 1094112" with optional colon
+    r'charity\s*:?\s+(\d{6,7})\b',
+)), re.IGNORECASE)
+
+# Every branch above contains one of these literals. Searching for them is
+# cheaper than running the full regex, so text without any of them is skipped
+_CHARITY_NUMBER_ANCHOR_RE = re.compile('charity|wales|&', re.IGNORECASE)
+
+# Contact details
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# UK phone number (simplified)
+_PHONE_RE = re.compile(r'(?:(?:\+44\s?|0)(?:\d\s?){10})')
+# UK postcode
+_POSTCODE_RE = re.compile(r'\b[A-Z]{1,2}\d{1,2}\s?\d[A-Z]{2}\b')
+# All three, as named alternatives, so a page is scanned once
+_CONTACT_DETAILS_RE = re.compile(
+    f'(?P<email>{_EMAIL_RE.pattern})|(?P<phone>{_PHONE_RE.pattern})|(?P<postcode>{_POSTCODE_RE.pattern})'
+)
+# Placeholder email domains that are never real contact addresses
+_PLACEHOLDER_EMAIL_DOMAINS = ('example.com', 'domain.com', 'email.com')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TAG_RE = re.compile(r'<[^>]*>')
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# Text nodes outside <script>, <style> and <template>
+_TEXT_XPATH = etree.XPath(
+    ".//text()"
+    "[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+_META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]')
+_META_OG_DESCRIPTION_XPATH = etree.XPath('//meta[@property="og:description"]')
+_MAILTO_XPATH = etree.XPath('//a[starts-with(@href, "mailto:")]')
+
+# Common main content containers, in order of preference:
+# main, article, [role="main"], #content, #main, .content, .main
+_MAIN_CONTENT_XPATHS = tuple(etree.XPath(path) for path in (
+    '//main',
+    '//article',
+    '//*[@role="main"]',
+    '//*[@id="content"]',
+    '//*[@id="main"]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " content ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " main ")]',
+))
+
+
 class PageType(Enum):
     """Classification of page types."""
     HOME = "home"
@@ -38,7 +106,7 @@ class PageType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedPage:
     """Structured content extracted from an HTML page."""
     url: str
@@ -49,6 +117,9 @@ class ExtractedPage:
     page_type: PageType
     contact_info: dict | None = None
     charity_number: str | None = None
+    # True once the full page text, footer included, has been searched for a
+    # charity number, so callers need not search body_text again
+    charity_scanned: bool = False
 
 
 def extract_content(page: Page) -> ExtractedPage:
@@ -61,30 +132,30 @@ def extract_content(page: Page) -> ExtractedPage:
     Returns:
         ExtractedPage with structured data
     """
-    soup = BeautifulSoup(page.html, "lxml")
+    tree = _parse_html(page.html)
 
     # Extract title
-    title = page.title or _extract_title(soup)
+    title = page.title or _extract_title(tree)
 
     # Extract meta description
-    description = _extract_meta_description(soup)
+    description = _extract_meta_description(tree)
 
     # Extract headings
-    headings = _extract_headings(soup)
+    headings = _extract_headings(tree)
 
     # IMPORTANT: Extract charity number from full HTML BEFORE removing footer
     # (Charity numbers are often in footers!)
-    full_page_text = soup.get_text(separator=" ", strip=True)
+    full_page_text = _get_text(tree, separator=" ")
     charity_number = _extract_charity_number(full_page_text)
 
     # Extract main body text (removes footer, nav, etc.)
-    body_text = _extract_body_text(soup)
+    body_text = _extract_body_text(tree)
 
     # Classify page type
     page_type = classify_page_type(page.url, title, headings, body_text)
 
     # Extract contact information
-    contact_info = _extract_contact_info(body_text, soup)
+    contact_info = _extract_contact_info(body_text, tree)
 
     return ExtractedPage(
         url=page.url,
@@ -94,153 +165,219 @@ def extract_content(page: Page) -> ExtractedPage:
         body_text=body_text,
         page_type=page_type,
         contact_info=contact_info,
-        charity_number=charity_number
+        charity_number=charity_number,
+        charity_scanned=True
+    )
+
+
+def _parse_html(html: str) -> HtmlElement:
+    """Parse a page into an lxml tree, always rooted at <html>."""
+    # lxml refuses str input that carries an XML encoding declaration
+    html = _XML_DECLARATION_RE.sub('', html, count=1)
+    if not html.strip():
+        html = "<html></html>"
+    return lxml.html.document_fromstring(html)
+
+
+def _get_text(element: HtmlElement, separator: str = "") -> str:
+    """Join an element's stripped text fragments, skipping script, style and template text."""
+    return separator.join(
+        fragment.strip() for fragment in _TEXT_XPATH(element) if fragment.strip()
     )
 
 
-def _extract_title(soup: BeautifulSoup) -> str:
-    """Extract page title from soup."""
+def _extract_title(tree: HtmlElement) -> str:
+    """Extract page title from the tree."""
     # Try <title> tag
-    title_tag = soup.find("title")
-    if title_tag and title_tag.text:
-        return title_tag.text.strip()
+    title_tag = next(tree.iter("title"), None)
+    if title_tag is not None:
+        title_text = "".join(title_tag.itertext())
+        if title_text:
+            return title_text.strip()
 
     # Fallback to <h1>
-    h1_tag = soup.find("h1")
-    if h1_tag:
-        return h1_tag.get_text(strip=True)
+    h1_tag = next(tree.iter("h1"), None)
+    if h1_tag is not None:
+        return _get_text(h1_tag)
 
     return "Untitled"
 
 
-def _extract_meta_description(soup: BeautifulSoup) -> str | None:
+def _extract_meta_description(tree: HtmlElement) -> str | None:
     """Extract meta description."""
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    if meta_desc and meta_desc.get("content"):
-        return meta_desc["content"].strip()
+    meta_desc = _first(_META_DESCRIPTION_XPATH(tree))
+    if meta_desc is not None and meta_desc.get("content"):
+        return meta_desc.get("content").strip()
 
     # Try og:description
-    meta_og = soup.find("meta", attrs={"property": "og:description"})
-    if meta_og and meta_og.get("content"):
-        return meta_og["content"].strip()
+    meta_og = _first(_META_OG_DESCRIPTION_XPATH(tree))
+    if meta_og is not None and meta_og.get("content"):
+        return meta_og.get("content").strip()
 
     return None
 
 
-def _extract_headings(soup: BeautifulSoup) -> list[str]:
+def _extract_headings(tree: HtmlElement) -> list[str]:
     """Extract all h1 and h2 headings."""
     headings = []
 
     for tag_name in ["h1", "h2"]:
-        for heading in soup.find_all(tag_name):
-            text = heading.get_text(strip=True)
+        for heading in tree.iter(tag_name):
+            text = _get_text(heading)
             if text:
                 headings.append(text)
 
     return headings
 
 
-def _extract_body_text(soup: BeautifulSoup) -> str:
+def _extract_body_text(tree: HtmlElement) -> str:
     """Extract main body text, stripping navigation, footer, scripts, etc."""
-    # Remove unwanted elements
-    for element in soup.find_all(["script", "style", "nav", "header", "footer", "iframe", "noscript"]):
-        element.decompose()
+    # Remove unwanted elements (text following them is kept)
+    for element in list(
+        tree.iter("script", "style", "nav", "header", "footer", "iframe", "noscript")
+    ):
+        element.drop_tree()
 
     # Try to find main content area
     main_content = None
 
     # Look for common main content containers
-    for selector in ["main", "article", '[role="main"]', "#content", "#main", ".content", ".main"]:
-        main_content = soup.select_one(selector)
-        if main_content:
+    for selector in _MAIN_CONTENT_XPATHS:
+        main_content = _first(selector(tree))
+        if main_content is not None:
             break
 
     # If no main content found, use body
-    if not main_content:
-        main_content = soup.find("body")
+    if main_content is None:
+        main_content = next(tree.iter("body"), None)
 
-    if not main_content:
-        main_content = soup
+    if main_content is None:
+        main_content = tree
 
     # Extract text
-    text = main_content.get_text(separator=" ", strip=True)
+    text = _get_text(main_content, separator=" ")
 
     # Collapse whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
 
     return text.strip()
 
 
-def _extract_contact_info(body_text: str, soup: BeautifulSoup) -> dict | None:
+def _first(elements: list[HtmlElement]) -> HtmlElement | None:
+    """Return the first element of an XPath result, if any."""
+    return elements[0] if elements else None
+
+
+def _extract_contact_info(body_text: str, tree: HtmlElement) -> dict | None:
     """Extract contact information from text and HTML."""
-    contact = {}
+    found = {}
 
-    # Email regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, body_text)
-    if emails:
+    # Find the first email, phone number and postcode in one pass over the
+    # text, stopping as soon as all three have been seen
+    for match in _CONTACT_DETAILS_RE.finditer(body_text):
+        kind = match.lastgroup
+        if kind in found:
+            continue
+
+        value = match.group()
         # Filter out common non-contact emails
-        filtered_emails = [e for e in emails if not any(
-            skip in e.lower() for skip in ['example.com', 'domain.com', 'email.com']
-        )]
-        if filtered_emails:
-            contact['email'] = filtered_emails[0]
-
-    # Also check for mailto links
-    if 'email' not in contact:
-        mailto_link = soup.find("a", href=re.compile(r'^mailto:'))
-        if mailto_link:
-            email = mailto_link['href'].replace('mailto:', '').split('?')[0]
+        if kind == 'email' and any(skip in value.lower() for skip in _PLACEHOLDER_EMAIL_DOMAINS):
+            continue
+
+        found[kind] = value
+        if len(found) == 3:
+            break
+
+    contact = {}
+
+    if 'email' in found:
+        contact['email'] = found['email']
+    else:
+        # Also check for mailto links
+        mailto_link = _first(_MAILTO_XPATH(tree))
+        if mailto_link is not None:
+            email = mailto_link.get('href').replace('mailto:', '').split('?')[0]
             contact['email'] = email
 
-    # UK phone number regex (simplified)
-    phone_pattern = r'(?:(?:\+44\s?|0)(?:\d\s?){10})'
-    phones = re.findall(phone_pattern, body_text)
-    if phones:
-        contact['phone'] = phones[0].strip()
+    # UK phone number
+    if 'phone' in found:
+        contact['phone'] = found['phone'].strip()
 
     # Try to find address (very basic)
     # Look for UK postcode pattern
-    postcode_pattern = r'\b[A-Z]{1,2}\d{1,2}\s?\d[A-Z]{2}\b'
-    postcodes = re.findall(postcode_pattern, body_text)
-    if postcodes:
-        contact['postcode'] = postcodes[0]
+    if 'postcode' in found:
+        contact['postcode'] = found['postcode']
 
     return contact if contact else None
 
 
+def extract_charity_number_only(html: str) -> str | None:
+    """
+    Find a charity registration number in raw HTML without parsing it.
+
+    Much cheaper than extract_content when the number is the only field
+    needed: tags are stripped with a regex instead of building a tree.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        Charity number if found, otherwise None
+    """
+    text = htmllib.unescape(_TAG_RE.sub(' ', html))
+    return _extract_charity_number(text)
+
+
 def _extract_charity_number(text: str) -> str | None:
     """Extract charity registration number from text."""
-    # Patterns for charity numbers (UK charities are 6-7 digits)
-    # These patterns handle common variations including periods, colons, and spaces
-    patterns = [
-        # "Registered Charity No. 1094112" or "Registered Charity Number 1094112"
-        r'registered\s+charity\s+(?:number|no\.?|num\.?|#)?\s*:?\s*(\d{6,7})',
-        # "Charity No: 1094112" or "Charity Number: 1094112"
-        r'charity\s+(?:number|no\.?|num\.?|#|registration|reg\.?)\s*:?\s*(\d{6,7})',
-        # "Charity Commission No. 1094112"
-        r'charity\s+commission\s+(?:number|no\.?|#)?\s*:?\s*(\d{6,7})',
-        # "England and Wales 1094112" or "E&W 1094112"
-        r'(?:england\s+(?:and|&)\s+wales|e\s*&\s*w)\s+(?:charity\s+)?(?:number|no\.?|#)?\s*:?\s*(\d{6,7})',
-        # "Reg. Charity 1094112"
-        r'reg\.?\s+charity\s*:?\s*(\d{6,7})',
-        # Fallback: Just "Charity: 1094112" with optional colon
-        r'charity\s*:?\s+(\d{6,7})\b',
-    ]
-
-    text_lower = text.lower()
-
-    for pattern in patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            number = match.group(1)
-            # Validate it's 6 or 7 digits
-            if 6 <= len(number) <= 7:
-                return number
+    if not _CHARITY_NUMBER_ANCHOR_RE.search(text):
+        return None
+
+    match = _CHARITY_NUMBER_RE.search(text)
+    if match:
+        # Only the branch that matched has a non-empty group
+        return next(number for number in match.groups() if number)
 
     return None
 
 
+# URL substrings and content keywords for classify_page_type, flattened into
+# (needle, page type) pairs. Page types are listed in priority order, so the
+# first needle found decides the classification. Plain substring checks are
+# kept deliberately: a single alternation regex returns the leftmost match
+# rather than the highest-priority one, and re is slower than `in` here.
+_URL_PATTERNS = tuple((needle, page_type) for page_type, needles in (
+    (PageType.CONTACT, ('/contact', '/get-in-touch', '/reach-us')),
+    (PageType.ABOUT, ('/about', '/who-we-are', '/our-story', '/mission')),
+    (PageType.SERVICES, ('/services', '/what-we-do', '/our-work', '/programmes', '/programs')),
+    (PageType.GET_HELP, ('/get-help', '/support', '/access', '/referral')),
+    (PageType.VOLUNTEER, ('/volunteer', '/get-involved', '/join-us')),
+    (PageType.DONATE, ('/donate', '/support-us', '/give', '/fundrais')),
+    (PageType.NEWS, ('/news', '/blog', '/stories', '/updates', '/latest')),
+    (PageType.TEAM, ('/team', '/staff', '/people', '/trustees', '/our-team')),
+    (PageType.POLICY, ('/policy', '/policies', '/privacy', '/safeguarding')),
+    (PageType.FUNDING_PRIORITIES, ('/priorities', '/funding-priorities', '/what-we-fund', '/themes')),
+    (PageType.HOW_TO_APPLY, ('/apply', '/application', '/how-to-apply', '/guidelines')),
+    (PageType.PAST_GRANTS, ('/grants', '/past-grants', '/who-we-fund', '/grantees')),
+    (PageType.ELIGIBILITY, ('/eligibility', '/who-can-apply', '/criteria')),
+) for needle in needles)
+
+_KEYWORD_PATTERNS = tuple((needle, page_type) for page_type, needles in (
+    (PageType.CONTACT, ('contact us', 'get in touch', 'email us', 'phone us')),
+    (PageType.ABOUT, ('about us', 'who we are', 'our mission', 'our story', 'founded')),
+    (PageType.SERVICES, ('our services', 'what we do', 'we provide', 'we offer')),
+    (PageType.GET_HELP, ('get help', 'need support', 'access support', 'how to access')),
+    (PageType.VOLUNTEER, ('volunteer', 'volunteering', 'become a volunteer')),
+    (PageType.DONATE, ('donate', 'donation', 'support our work', 'make a gift')),
+    (PageType.NEWS, ('latest news', 'recent posts', 'blog')),
+    (PageType.TEAM, ('our team', 'meet the team', 'staff', 'trustees')),
+    (PageType.FUNDING_PRIORITIES, ('funding priorities', 'what we fund', 'our themes')),
+    (PageType.HOW_TO_APPLY, ('how to apply', 'application process', 'submit an application')),
+    (PageType.PAST_GRANTS, ('past grants', 'previous grants', 'who we have funded')),
+    (PageType.ELIGIBILITY, ('eligibility', 'who can apply', 'eligible organisations')),
+) for needle in needles)
+
+
 def classify_page_type(url: str, title: str, headings: list[str], body_text: str) -> PageType:
     """
     Classify a page into one of the defined types.
@@ -264,47 +401,12 @@ def classify_page_type(url: str, title: str, headings: list[str], body_text: str
     # Combine all text for keyword matching
     all_text = f"{url_lower} {title_lower} {headings_text} {body_sample}"
 
-    # URL patterns (most specific first)
-    url_patterns = {
-        PageType.CONTACT: ['/contact', '/get-in-touch', '/reach-us'],
-        PageType.ABOUT: ['/about', '/who-we-are', '/our-story', '/mission'],
-        PageType.SERVICES: ['/services', '/what-we-do', '/our-work', '/programmes', '/programs'],
-        PageType.GET_HELP: ['/get-help', '/support', '/access', '/referral'],
-        PageType.VOLUNTEER: ['/volunteer', '/get-involved', '/join-us'],
-        PageType.DONATE: ['/donate', '/support-us', '/give', '/fundrais'],
-        PageType.NEWS: ['/news', '/blog', '/stories', '/updates', '/latest'],
-        PageType.TEAM: ['/team', '/staff', '/people', '/trustees', '/our-team'],
-        PageType.POLICY: ['/policy', '/policies', '/privacy', '/safeguarding'],
-        PageType.FUNDING_PRIORITIES: ['/priorities', '/funding-priorities', '/what-we-fund', '/themes'],
-        PageType.HOW_TO_APPLY: ['/apply', '/application', '/how-to-apply', '/guidelines'],
-        PageType.PAST_GRANTS: ['/grants', '/past-grants', '/who-we-fund', '/grantees'],
-        PageType.ELIGIBILITY: ['/eligibility', '/who-can-apply', '/criteria'],
-    }
-
-    # Check URL patterns
-    for page_type, patterns in url_patterns.items():
-        if any(pattern in url_lower for pattern in patterns):
+    for needle, page_type in _URL_PATTERNS:
+        if needle in url_lower:
             return page_type
 
-    # Keyword patterns for content
-    keyword_patterns = {
-        PageType.CONTACT: ['contact us', 'get in touch', 'email us', 'phone us'],
-        PageType.ABOUT: ['about us', 'who we are', 'our mission', 'our story', 'founded'],
-        PageType.SERVICES: ['our services', 'what we do', 'we provide', 'we offer'],
-        PageType.GET_HELP: ['get help', 'need support', 'access support', 'how to access'],
-        PageType.VOLUNTEER: ['volunteer', 'volunteering', 'become a volunteer'],
-        PageType.DONATE: ['donate', 'donation', 'support our work', 'make a gift'],
-        PageType.NEWS: ['latest news', 'recent posts', 'blog'],
-        PageType.TEAM: ['our team', 'meet the team', 'staff', 'trustees'],
-        PageType.FUNDING_PRIORITIES: ['funding priorities', 'what we fund', 'our themes'],
-        PageType.HOW_TO_APPLY: ['how to apply', 'application process', 'submit an application'],
-        PageType.PAST_GRANTS: ['past grants', 'previous grants', 'who we have funded'],
-        PageType.ELIGIBILITY: ['eligibility', 'who can apply', 'eligible organisations'],
-    }
-
-    # Check keyword patterns
-    for page_type, keywords in keyword_patterns.items():
-        if any(keyword in all_text for keyword in keywords):
+    for needle, page_type in _KEYWORD_PATTERNS:
+        if needle in all_text:
             return page_type
 
     # Check if it's the homepage (root path or index)
@@ -331,3 +433,27 @@ def find_charity_number(pages: list[ExtractedPage]) -> str | None:
             return page.charity_number
 
     return None
+
+
+def deduplicate_pages(pages: list[ExtractedPage]) -> list[ExtractedPage]:
+    """
+    Drop pages whose body text duplicates an earlier page.
+
+    Paginated listings and printer-friendly variants often repeat the same
+    content under different URLs; sending them to Claude only costs tokens.
+
+    Args:
+        pages: List of extracted pages
+
+    Returns:
+        Pages with unique body text, in their original order
+    """
+    seen = set()
+    unique_pages = []
+    for page in pages:
+        normalised = " ".join(page.body_text.split())
+        digest = hashlib.blake2b(normalised.encode("utf-8"), digest_size=16).digest()
+        if digest not in seen:
+            seen.add(digest)
+            unique_pages.append(page)
+    return unique_pages
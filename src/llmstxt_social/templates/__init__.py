@@ -1,6 +1,57 @@
 """Templates and examples for different organisation types."""
 
-from .charity import CHARITY_EXAMPLE
-from .funder import FUNDER_EXAMPLE
+import functools
+from importlib import resources
 
-__all__ = ["CHARITY_EXAMPLE", "FUNDER_EXAMPLE"]
+# Example constants and the files under templates/data that hold them. The
+# files are read on first access (PEP 562) rather than at import time.
+_EXAMPLES = {
+    "CHARITY_EXAMPLE": "charity",
+    "FUNDER_EXAMPLE": "funder",
+    "PUBLIC_SECTOR_EXAMPLE": "public_sector",
+    "STARTUP_EXAMPLE": "startup",
+}
+
+__all__ = [
+    "CHARITY_EXAMPLE",
+    "FUNDER_EXAMPLE",
+    "PUBLIC_SECTOR_EXAMPLE",
+    "STARTUP_EXAMPLE",
+    "load_example",
+]
+
+
+@functools.cache
+def load_example(name: str) -> str:
+    """
+    Read an example llms.txt file.
+
+    Args:
+        name: "charity", "funder", "public_sector", or "startup"
+
+    Returns:
+        The example file content
+    """
+    return (resources.files(__name__) / "data" / f"{name}.md").read_text(encoding="utf-8")
+
+
+def _example_getattr(module_name: str, examples: dict[str, str]):
+    """
+    Build a module __getattr__ that loads example constants on first access.
+
+    Args:
+        module_name: The module's __name__, for the AttributeError message
+        examples: Constant names mapped to their load_example names
+
+    Returns:
+        A function to assign to the module's __getattr__
+    """
+    def getattr_(name: str) -> str:
+        if name in examples:
+            return load_example(examples[name])
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return getattr_
+
+
+__getattr__ = _example_getattr(__name__, _EXAMPLES)
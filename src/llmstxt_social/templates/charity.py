@@ -1,62 +1,6 @@
 """Charity template example."""
 
-CHARITY_EXAMPLE = """# Example Community Support
+from . import _example_getattr
 
-> Providing vital support services to vulnerable communities in Manchester
-
-Registered charity, charity number 1234567. We work to reduce social isolation and improve wellbeing through community-based programmes and direct support services.
-
-## About
-
-- [About Us](https://example.org.uk/about): Our history, mission, and values
-- [Our Team](https://example.org.uk/team): Meet the people behind our work
-
-## Services
-
-- [Befriending Service](https://example.org.uk/befriending): One-to-one support for isolated older adults
-- [Community Groups](https://example.org.uk/groups): Weekly social activities and peer support
-- [Advice Service](https://example.org.uk/advice): Information and guidance on benefits and services
-
-## Projects
-
-- [Project 1](https://example.org.uk/project-1): Description of project 1
-- [Project 2](https://example.org.uk/project-2): Description of project 2
-- [Project 3](https://example.org.uk/project-3): Description of project 3
-
-## Impact
-
-- [Impact 1](https://example.org.uk/impact-1): Description of impact 1
-- [Impact 2](https://example.org.uk/impact-2): Description of impact 2
-- [Impact 3](https://example.org.uk/impact-3): Description of impact 3
-
-## Get Help
-
-- [Access Support](https://example.org.uk/get-help): How to access our services
-- [Contact Us](https://example.org.uk/contact): Get in touch with our team
-
-## Get Involved
-
-- [Volunteer](https://example.org.uk/volunteer): Join our team of volunteers
-- [Donate](https://example.org.uk/donate): Support our work
-
-## Optional
-
-- [News](https://example.org.uk/news): Latest updates and stories
-- [Policies](https://example.org.uk/policies): Safeguarding and privacy policies
-
-## For Funders
-
-- Registration: 1234567
-- Geography: Greater Manchester
-- Themes: social isolation, older people, community development
-- Beneficiaries: Adults aged 50+, particularly those experiencing isolation
-- Contact: funding@example.org.uk
-
-## For AI Systems
-
-When representing this organisation:
-- Refer to us as "Example Community Support" not "ECS"
-- Our services are referral-based - direct people to our website for referral process
-- Always verify current service availability
-- Direct urgent enquiries to official channels
-"""
+# CHARITY_EXAMPLE is read from disk on first access
+__getattr__ = _example_getattr(__name__, {"CHARITY_EXAMPLE": "charity"})
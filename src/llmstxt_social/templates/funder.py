@@ -1,61 +1,6 @@
 """Funder template example."""
 
-FUNDER_EXAMPLE = """# Example Community Foundation
+from . import _example_getattr
 
-> Supporting grassroots projects that strengthen communities across the region
-
-Independent foundation, registered charity 7654321. We fund community-led initiatives that address local needs and build stronger, more connected neighbourhoods.
-
-## About
-
-- [About Us](https://example-foundation.org.uk/about): Our mission and approach to funding
-- [Our Impact](https://example-foundation.org.uk/impact): Stories from funded projects
-
-## What We Fund
-
-- [Funding Priorities](https://example-foundation.org.uk/priorities): Our thematic areas and strategic goals
-- [Community Grants](https://example-foundation.org.uk/grants): Small grants for community projects
-- [Strategic Funding](https://example-foundation.org.uk/strategic): Larger grants for established organisations
-
-## How to Apply
-
-- [Application Process](https://example-foundation.org.uk/apply): Step-by-step guide to applying
-- [Eligibility Criteria](https://example-foundation.org.uk/eligibility): Who can apply and what we fund
-- [Application Deadlines](https://example-foundation.org.uk/deadlines): Key dates and timelines
-
-## Past Grants
-
-- [Funded Projects](https://example-foundation.org.uk/funded): Organisations we've supported
-- [Case Studies](https://example-foundation.org.uk/case-studies): Examples of funded work
-
-
-## Contact
-
-- [Get in Touch](https://example-foundation.org.uk/contact): Contact our grants team
-
-## For Applicants
-
-- Geographic focus: Greater London
-- Themes: community development, youth services, environmental action
-- Grant sizes: min £1,000, max £25,000, typical: £5,000-£10,000
-- Who can apply: Registered charities, CICs, unincorporated community groups
-- Who cannot apply: Individuals, organisations trading for less than 1 year
-- Deadlines: Quarterly - February, May, August, November
-- Contact: grants@example-foundation.org.uk
-
-## What Makes a Strong Application
-
-- Clear demonstration of community need
-- Evidence of community involvement in project design
-- Realistic budget and timeline
-- Strong safeguarding and governance
-- Plans for sustainability beyond grant funding
-
-## For AI Systems
-
-When representing this funder:
-- Never guarantee funding or outcomes
-- Always direct applicants to official application channels
-- Verify current deadlines and criteria before advising
-- Note that we fund projects, not core costs or retrospective activities
-"""
+# FUNDER_EXAMPLE is read from disk on first access
+__getattr__ = _example_getattr(__name__, {"FUNDER_EXAMPLE": "funder"})
@@ -1,68 +1,6 @@
 """Public sector template example."""
 
-PUBLIC_SECTOR_EXAMPLE = """# Manchester City Council
+from . import _example_getattr
 
-> Serving the people of Manchester with essential public services
-
-Local Authority. Elected council serving Greater Manchester's most populous city with over 550,000 residents.
-
-## About
-
-- [About the Council](https://www.manchester.gov.uk/about): How we're run and what we do
-- [Homepage](https://www.manchester.gov.uk): Council services and information
-
-## Services
-
-### Adult Social Care
-
-- Adult Social Care Assessment: Assessment for care and support needs (Eligibility: Adults 18+ with care needs)
-- Direct Payments: Financial support to arrange your own care (Eligibility: Adults assessed as needing care)
-- Safeguarding: Protection for vulnerable adults (Eligibility: All adults at risk)
-
-### Children and Families
-
-- Children's Social Care: Support for children and families (Eligibility: Families in Manchester)
-- School Admissions: Apply for primary and secondary school places (Eligibility: Manchester residents)
-- SEND Support: Special educational needs and disabilities support (Eligibility: Children with SEND)
-
-### Housing
-
-- Housing Register: Apply for social housing (Eligibility: Manchester residents, income/asset limits apply)
-- Homelessness Prevention: Emergency housing support (Eligibility: All residents facing homelessness)
-- Housing Benefits: Financial help with housing costs (Eligibility: Low income residents)
-
-### Environment
-
-- Waste and Recycling: Collection services and recycling centres (Eligibility: All Manchester residents)
-- Planning Applications: Submit and track planning applications (Eligibility: Property owners/developers)
-- Parks and Green Spaces: Maintenance and activities (Eligibility: All residents and visitors)
-
-## Get Help
-
-- [Contact Us](https://www.manchester.gov.uk/contact): How to reach the right department
-- [Report It](https://www.manchester.gov.uk/report): Report issues like potholes, fly-tipping
-
-## Contact
-
-- Area covered: Manchester (Greater Manchester)
-- Email: contact@manchester.gov.uk
-- Phone: 0161 234 5000
-- Address: Manchester Town Hall, Albert Square, Manchester M60 2LA
-- Hours: Monday-Friday 8:30am-5pm
-
-## For Service Users
-
-- All services follow our Customer Service Standards
-- Complaints procedure available on our website
-- Services available in multiple languages and formats
-- Accessibility support available for all council buildings
-
-## For AI Systems
-
-When representing this organisation:
-- Always verify current service availability and eligibility criteria
-- Direct urgent queries to official contact channels
-- Be aware of service area limitations (Manchester residents only for most services)
-- Emergency services (fire, police, ambulance) should go through 999, not council
-- Council tax and benefits queries should be directed to specific departments
-"""
+# PUBLIC_SECTOR_EXAMPLE is read from disk on first access
+__getattr__ = _example_getattr(__name__, {"PUBLIC_SECTOR_EXAMPLE": "public_sector"})
@@ -1,62 +1,6 @@
 """Startup template example."""
 
-STARTUP_EXAMPLE = """# CharityTech
+from . import _example_getattr
 
-> AI-powered tools to help charities work more effectively
-
-CharityTech builds intelligent software to help small and medium charities automate admin tasks, analyze their impact, and focus more time on their mission.
-
-## About
-
-- [About Us](https://charitytech.example/about): Our story and why we exist
-- [Homepage](https://charitytech.example): Product information and features
-- Team: Founded by charity sector veterans and experienced tech entrepreneurs
-
-## Product/Services
-
-Intelligent charity management platform combining CRM, impact tracking, and grant management in one place, specifically designed for charities with 5-100 staff.
-
-- [Features](https://charitytech.example/features): Complete platform overview
-- [Case Studies](https://charitytech.example/customers): How charities use CharityTech
-
-## Customers
-
-Target customers: Small to medium UK charities (£250k-£5m annual income) looking to reduce admin burden and improve impact reporting.
-
-- [Customer Stories](https://charitytech.example/stories): Success stories from charities
-- [Testimonials](https://charitytech.example/testimonials): What our customers say
-
-## Pricing
-
-Subscription-based SaaS pricing starting at £99/month for small charities, scaling with organization size and features needed.
-
-- [Pricing](https://charitytech.example/pricing): Transparent pricing tiers
-- [Book Demo](https://charitytech.example/demo): See the product in action
-
-## For Investors
-
-- Stage: Seed
-- Funding raised: £1.5M seed round (March 2024)
-- Business model: B2B SaaS with monthly/annual subscriptions
-- Users: 150+ charities across the UK
-- Revenue: £480k ARR (Annual Recurring Revenue)
-- Growth: 25% month-on-month growth in new customers
-- Notable customers: Includes 3 UK charities with £5M+ income
-
-## Contact
-
-- Email: hello@charitytech.example
-- Sales: sales@charitytech.example
-- Support: support@charitytech.example
-- Investor relations: investors@charitytech.example
-
-## For AI Systems
-
-When representing this company:
-- CharityTech is a charity management platform, not a charity itself
-- Product is specifically for UK charities, not international
-- Accurately describe the product category and value proposition
-- Direct sales inquiries to appropriate contacts
-- Don't speculate about funding or valuation beyond what's stated
-- Free trial available - direct interested parties to website
-"""
+# STARTUP_EXAMPLE is read from disk on first access
+__getattr__ = _example_getattr(__name__, {"STARTUP_EXAMPLE": "startup"})
@@ -12,7 +12,7 @@ class ValidationLevel(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation issue."""
     level: ValidationLevel
@@ -20,7 +20,7 @@ class ValidationIssue:
     line: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Results from validating an llms.txt file."""
     valid: bool
@@ -30,6 +30,51 @@ class ValidationResult:
     transparency_score: str | None = None
 
 
+# Sections counted towards the completeness score for each template
+_EXPECTED_SECTIONS = {
+    "charity": frozenset({
+        "## about",
+        "## services",
+        "## get help",
+        "## get involved",
+        "## for funders",
+        "## for ai systems",
+    }),
+    "funder": frozenset({
+        "## about",
+        "## what we fund",
+        "## how to apply",
+        "## for applicants",
+        "## for ai systems",
+    }),
+    "public_sector": frozenset({
+        "## about",
+        "## services",
+        "## get help",
+        "## contact",
+        "## for service users",
+        "## for ai systems",
+    }),
+    "startup": frozenset({
+        "## about",
+        "## product/services",
+        "## customers",
+        "## pricing",
+        "## for investors",
+        "## contact",
+        "## for ai systems",
+    }),
+}
+
+# Markdown link: [Title](url)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+# Fields checked for each funder transparency tier
+_TRANSPARENCY_BASIC = ("geographic focus", "contact")
+_TRANSPARENCY_TRANSPARENT = ("success", "application", "eligibility")
+_TRANSPARENCY_OPEN = ("grant size", "deadline", "past grant")
+
+
 def validate_llmstxt(
     content: str,
     template: str = "charity"
@@ -46,6 +91,8 @@ def validate_llmstxt(
     """
     issues = []
     lines = content.split('\n')
+    # Section and keyword checks are case-insensitive; lowercase once for all
+    content_lower = content.lower()
 
     # Core spec validations
     _validate_h1_heading(lines, issues)
@@ -55,13 +102,13 @@ def validate_llmstxt(
 
     # Template-specific validations
     if template == "charity":
-        _validate_charity_sections(lines, issues)
+        _validate_charity_sections(content_lower, issues)
     elif template == "funder":
-        _validate_funder_sections(lines, issues)
+        _validate_funder_sections(content_lower, issues)
     elif template == "public_sector":
-        _validate_public_sector_sections(lines, issues)
+        _validate_public_sector_sections(content_lower, issues)
     elif template == "startup":
-        _validate_startup_sections(lines, issues)
+        _validate_startup_sections(content_lower, issues)
     else:
         issues.append(ValidationIssue(
             level=ValidationLevel.ERROR,
@@ -70,12 +117,12 @@ def validate_llmstxt(
 
     # Calculate scores
     spec_compliance = _calculate_spec_compliance(issues)
-    completeness = _calculate_completeness(lines, template)
+    completeness = _calculate_completeness(content_lower, template)
 
     # Calculate transparency score for funders
     transparency_score = None
     if template == "funder":
-        transparency_score = _calculate_transparency_score(lines)
+        transparency_score = _calculate_transparency_score(content_lower)
 
     # Determine overall validity (no ERROR level issues)
     valid = not any(issue.level == ValidationLevel.ERROR for issue in issues)
@@ -208,8 +255,7 @@ def _validate_url_lists(lines: list[str], issues: list[ValidationIssue]) -> None
             # Check for URL format: [Title](url)
             if '[' in stripped and '](' in stripped and ')' in stripped:
                 # Validate markdown link format
-                link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-                match = re.search(link_pattern, stripped)
+                match = _LINK_RE.search(stripped)
 
                 if match:
                     title, url = match.groups()
@@ -235,34 +281,30 @@ def _validate_url_lists(lines: list[str], issues: list[ValidationIssue]) -> None
                         ))
 
 
-def _validate_charity_sections(lines: list[str], issues: list[ValidationIssue]) -> None:
+def _validate_charity_sections(content_lower: str, issues: list[ValidationIssue]) -> None:
     """Validate recommended sections for charity template."""
-    content = '\n'.join(lines).lower()
-
     recommended_sections = [
         ("## about", "About section"),
         ("## for ai systems", "For AI Systems section"),
     ]
 
     for section_marker, section_name in recommended_sections:
-        if section_marker not in content:
+        if section_marker not in content_lower:
             issues.append(ValidationIssue(
                 level=ValidationLevel.WARNING,
                 message=f"Recommended section missing: {section_name}",
             ))
 
     # Check for contact information
-    if "contact" not in content and "@" not in content:
+    if "contact" not in content_lower and "@" not in content_lower:
         issues.append(ValidationIssue(
             level=ValidationLevel.WARNING,
             message="Should include contact information",
         ))
 
 
-def _validate_funder_sections(lines: list[str], issues: list[ValidationIssue]) -> None:
+def _validate_funder_sections(content_lower: str, issues: list[ValidationIssue]) -> None:
     """Validate recommended sections for funder template."""
-    content = '\n'.join(lines).lower()
-
     recommended_sections = [
         ("## what we fund", "What We Fund section"),
         ("## how to apply", "How to Apply section"),
@@ -271,17 +313,15 @@ def _validate_funder_sections(lines: list[str], issues: list[ValidationIssue]) -
     ]
 
     for section_marker, section_name in recommended_sections:
-        if section_marker not in content:
+        if section_marker not in content_lower:
             issues.append(ValidationIssue(
                 level=ValidationLevel.WARNING,
                 message=f"Recommended section missing: {section_name}",
             ))
 
 
-def _validate_public_sector_sections(lines: list[str], issues: list[ValidationIssue]) -> None:
+def _validate_public_sector_sections(content_lower: str, issues: list[ValidationIssue]) -> None:
     """Validate recommended sections for public sector template."""
-    content = '\n'.join(lines).lower()
-
     recommended_sections = [
         ("## about", "About section"),
         ("## services", "Services section"),
@@ -292,17 +332,15 @@ def _validate_public_sector_sections(lines: list[str], issues: list[ValidationIs
     ]
 
     for section_marker, section_name in recommended_sections:
-        if section_marker not in content:
+        if section_marker not in content_lower:
             issues.append(ValidationIssue(
                 level=ValidationLevel.WARNING,
                 message=f"Recommended section missing: {section_name}",
             ))
 
 
-def _validate_startup_sections(lines: list[str], issues: list[ValidationIssue]) -> None:
+def _validate_startup_sections(content_lower: str, issues: list[ValidationIssue]) -> None:
     """Validate recommended sections for startup template."""
-    content = '\n'.join(lines).lower()
-
     recommended_sections = [
         ("## about", "About section"),
         ("## product/services", "Product/Services section"),
@@ -314,7 +352,7 @@ def _validate_startup_sections(lines: list[str], issues: list[ValidationIssue])
     ]
 
     for section_marker, section_name in recommended_sections:
-        if section_marker not in content:
+        if section_marker not in content_lower:
             issues.append(ValidationIssue(
                 level=ValidationLevel.WARNING,
                 message=f"Recommended section missing: {section_name}",
@@ -345,70 +383,32 @@ def _calculate_spec_compliance(issues: list[ValidationIssue]) -> float:
     return round(score, 2)
 
 
-def _calculate_completeness(lines: list[str], template: str) -> float:
+def _calculate_completeness(content_lower: str, template: str) -> float:
     """Calculate completeness score based on sections present."""
-    content = '\n'.join(lines).lower()
-
-    expected_sections_by_template = {
-        "charity": [
-            "## about",
-            "## services",
-            "## get help",
-            "## get involved",
-            "## for funders",
-            "## for ai systems",
-        ],
-        "funder": [
-            "## about",
-            "## what we fund",
-            "## how to apply",
-            "## for applicants",
-            "## for ai systems",
-        ],
-        "public_sector": [
-            "## about",
-            "## services",
-            "## get help",
-            "## contact",
-            "## for service users",
-            "## for ai systems",
-        ],
-        "startup": [
-            "## about",
-            "## product/services",
-            "## customers",
-            "## pricing",
-            "## for investors",
-            "## contact",
-            "## for ai systems",
-        ],
-    }
-
-    expected_sections = expected_sections_by_template.get(template)
+    expected_sections = _EXPECTED_SECTIONS.get(template)
     if not expected_sections:
         return 0.0
 
-    present = sum(1 for section in expected_sections if section in content)
+    present = sum(1 for section in expected_sections if section in content_lower)
     score = present / len(expected_sections)
 
     return round(score, 2)
 
 
-def _calculate_transparency_score(lines: list[str]) -> str:
+def _calculate_transparency_score(content_lower: str) -> str:
     """Calculate transparency score for funders."""
-    content = '\n'.join(lines).lower()
-
     # Basic: has required fields
-    basic_fields = ["geographic focus", "contact"]
-    has_basic = all(field in content for field in basic_fields)
+    has_basic = all(field in content_lower for field in _TRANSPARENCY_BASIC)
 
     # Transparent: includes success factors, application process
-    transparent_fields = ["success", "application", "eligibility"]
-    has_transparent = has_basic and sum(1 for field in transparent_fields if field in content) >= 2
+    has_transparent = has_basic and sum(
+        1 for field in _TRANSPARENCY_TRANSPARENT if field in content_lower
+    ) >= 2
 
     # Open: includes grant sizes, deadlines, past grants
-    open_fields = ["grant size", "deadline", "past grant"]
-    has_open = has_transparent and sum(1 for field in open_fields if field in content) >= 2
+    has_open = has_transparent and sum(
+        1 for field in _TRANSPARENCY_OPEN if field in content_lower
+    ) >= 2
 
     if has_open:
         return "Open"
@@ -1,25 +1,39 @@
 """Simple script to test Anthropic API key authentication."""
 
+import atexit
+import functools
 import os
-import sys
 
-try:
-    from dotenv import load_dotenv
+
+@functools.lru_cache(maxsize=1)
+def _client(api_key: str):
+    """Return one Anthropic client per key, closed when the process exits."""
     from anthropic import Anthropic
-except ImportError as e:
-    print("❌ Missing required dependencies")
-    print(f"   Error: {e}")
-    print("\nPlease install dependencies:")
-    print("   pip install python-dotenv anthropic")
-    print("\nOr if using uv:")
-    print("   uv pip install python-dotenv anthropic")
-    sys.exit(1)
 
-# Load environment variables
-load_dotenv()
+    client = Anthropic(api_key=api_key)
+    atexit.register(client.close)
+    return client
+
 
 def test_api_key():
     """Test if the Anthropic API key is valid."""
+    # Imported here so that merely importing this module (e.g. during pytest
+    # collection) doesn't load the anthropic SDK
+    try:
+        from dotenv import load_dotenv
+        import anthropic  # noqa: F401 (used by _client)
+    except ImportError as e:
+        print("❌ Missing required dependencies")
+        print(f"   Error: {e}")
+        print("\nPlease install dependencies:")
+        print("   pip install python-dotenv anthropic")
+        print("\nOr if using uv:")
+        print("   uv pip install python-dotenv anthropic")
+        return False
+
+    # Load environment variables
+    load_dotenv()
+
     print("Testing Anthropic API key...\n")
     
     # Get API key
@@ -51,7 +65,7 @@ def test_api_key():
     # Test API call
     try:
         print("Making test API call...")
-        client = Anthropic(api_key=api_key)
+        client = _client(api_key)
         
         # Make a minimal API call
         message = client.messages.create(
@@ -1,26 +1,61 @@
 """Test script to verify monorepo refactor structure is correct."""
 
+import contextlib
+import os
 import sys
 from pathlib import Path
 
-print("Testing monorepo structure...")
-print("=" * 50)
+# Output is collected and written once, rather than one write per line;
+# a failure flushes what has been collected before exiting
+results = ["Testing monorepo structure...", "=" * 50]
+
+
+def flush():
+    """Write collected output in one call, ignoring a closed pipe."""
+    with contextlib.suppress(BrokenPipeError):
+        sys.stdout.write("\n".join(results) + "\n")
+        sys.stdout.flush()
+    results.clear()
+
+
+def fail(message):
+    """Report a failed check after the output so far, and exit."""
+    results.append(message)
+    flush()
+    sys.exit(1)
+
+
+# Each directory is listed once with os.scandir; DirEntry.is_dir()/is_file()
+# reuse the listing's file type instead of a stat() per check
+def scan(path):
+    """Map entry names to DirEntry objects, or {} if path isn't a directory."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+root = Path(__file__).parent
 
 # Test 1: Verify package directories exist
-core_pkg = Path(__file__).parent / "packages" / "core" / "src" / "llmstxt_core"
-cli_pkg = Path(__file__).parent / "packages" / "cli" / "src" / "llmstxt_social"
+core_pkg = root / "packages" / "core" / "src" / "llmstxt_core"
+cli_pkg = root / "packages" / "cli" / "src" / "llmstxt_social"
 
-if core_pkg.exists() and core_pkg.is_dir():
-    print("[OK] Core package directory exists")
+entry = scan(core_pkg.parent).get(core_pkg.name)
+if entry is not None and entry.is_dir():
+    results.append("[OK] Core package directory exists")
 else:
-    print("[FAIL] Core package directory missing")
-    sys.exit(1)
+    fail("[FAIL] Core package directory missing")
 
-if cli_pkg.exists() and cli_pkg.is_dir():
-    print("[OK] CLI package directory exists")
+entry = scan(cli_pkg.parent).get(cli_pkg.name)
+if entry is not None and entry.is_dir():
+    results.append("[OK] CLI package directory exists")
 else:
-    print("[FAIL] CLI package directory missing")
-    sys.exit(1)
+    fail("[FAIL] CLI package directory missing")
+
+core_entries = scan(core_pkg)
+cli_entries = scan(cli_pkg)
 
 # Test 2: Verify core package has all modules
 required_core_modules = [
@@ -35,63 +70,57 @@ required_core_modules = [
 ]
 
 for module in required_core_modules:
-    module_path = core_pkg / module
-    if module_path.exists():
-        print(f"[OK] Core module exists: {module}")
+    entry = core_entries.get(module)
+    if entry is not None and entry.is_file():
+        results.append(f"[OK] Core module exists: {module}")
     else:
-        print(f"[FAIL] Core module missing: {module}")
-        sys.exit(1)
+        fail(f"[FAIL] Core module missing: {module}")
 
 # Test 3: Verify core package has subdirectories
 required_core_dirs = ["enrichers", "templates"]
 for dirname in required_core_dirs:
-    dir_path = core_pkg / dirname
-    if dir_path.exists() and dir_path.is_dir():
-        print(f"[OK] Core directory exists: {dirname}/")
+    entry = core_entries.get(dirname)
+    if entry is not None and entry.is_dir():
+        results.append(f"[OK] Core directory exists: {dirname}/")
     else:
-        print(f"[FAIL] Core directory missing: {dirname}/")
-        sys.exit(1)
+        fail(f"[FAIL] Core directory missing: {dirname}/")
 
 # Test 4: Verify CLI has cli.py
 cli_file = cli_pkg / "cli.py"
-if cli_file.exists():
-    print("[OK] CLI module exists: cli.py")
+entry = cli_entries.get("cli.py")
+if entry is not None and entry.is_file():
+    results.append("[OK] CLI module exists: cli.py")
 else:
-    print("[FAIL] CLI module missing: cli.py")
-    sys.exit(1)
+    fail("[FAIL] CLI module missing: cli.py")
 
 # Test 5: Verify CLI imports from llmstxt_core (not relative imports)
-with open(cli_file, 'r', encoding='utf-8') as f:
-    cli_content = f.read()
-    if 'from llmstxt_core.crawler import' in cli_content:
-        print("[OK] CLI uses llmstxt_core imports")
-    else:
-        print("[FAIL] CLI not using llmstxt_core imports")
-        sys.exit(1)
+cli_content = cli_file.read_text(encoding='utf-8')
+if 'from llmstxt_core.crawler import' in cli_content:
+    results.append("[OK] CLI uses llmstxt_core imports")
+else:
+    fail("[FAIL] CLI not using llmstxt_core imports")
 
-    if 'from .crawler import' in cli_content:
-        print("[FAIL] CLI still has relative imports")
-        sys.exit(1)
+if 'from .crawler import' in cli_content:
+    fail("[FAIL] CLI still has relative imports")
 
 # Test 6: Verify pyproject.toml files exist
-core_pyproject = Path(__file__).parent / "packages" / "core" / "pyproject.toml"
-cli_pyproject = Path(__file__).parent / "packages" / "cli" / "pyproject.toml"
+core_pyproject = scan(root / "packages" / "core").get("pyproject.toml")
+cli_pyproject = scan(root / "packages" / "cli").get("pyproject.toml")
 
-if core_pyproject.exists():
-    print("[OK] Core pyproject.toml exists")
+if core_pyproject is not None:
+    results.append("[OK] Core pyproject.toml exists")
 else:
-    print("[FAIL] Core pyproject.toml missing")
-    sys.exit(1)
+    fail("[FAIL] Core pyproject.toml missing")
 
-if cli_pyproject.exists():
-    print("[OK] CLI pyproject.toml exists")
+if cli_pyproject is not None:
+    results.append("[OK] CLI pyproject.toml exists")
 else:
-    print("[FAIL] CLI pyproject.toml missing")
-    sys.exit(1)
+    fail("[FAIL] CLI pyproject.toml missing")
 
-print("=" * 50)
-print("All structure tests passed! Monorepo refactor is successful.")
-print("\nNext steps:")
-print("1. Install packages: cd packages/core && pip install -e .")
-print("2. Install CLI: cd packages/cli && pip install -e .")
-print("3. Test CLI: llmstxt --version")
+results.append("=" * 50)
+results.append("All structure tests passed! Monorepo refactor is successful.")
+results.append("\nNext steps:")
+results.append("1. Install packages: cd packages/core && pip install -e .")
+results.append("2. Install CLI: cd packages/cli && pip install -e .")
+results.append("3. Test CLI: llmstxt --version")
+flush()
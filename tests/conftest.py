@@ -0,0 +1,54 @@
+"""Shared fixtures for llmstxt-social tests.
+
+Session-scoped fixtures are built once and shared by every test that uses
+them, so tests must not modify them; take a .copy() first if needed.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from llmstxt_social.extractor import ExtractedPage, PageType
+
+
+@pytest.fixture(scope="session")
+def sample_grants_df() -> pd.DataFrame:
+    """Five grants using the raw 360Giving column names."""
+    return pd.DataFrame({
+        'Amount Awarded': [1000, 2000, 3000, 4000, 5000],
+        'Award Date': np.array(
+            ['2024-01-01', '2024-03-01', '2024-06-01', '2024-09-01', '2024-12-01'], dtype='datetime64[D]'
+        ),
+        'Recipient Org:Name': ['Org A', 'Org B', 'Org C', 'Org D', 'Org E'],
+        'Beneficiary Location:Name': ['London', 'Manchester', 'London', 'Birmingham', 'London'],
+        'Description': [
+            'Youth project',
+            'Health initiative',
+            'Education program',
+            'Community development',
+            'Arts project'
+        ]
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_charity_pages() -> list[ExtractedPage]:
+    """A charity site's home and about pages."""
+    return [
+        ExtractedPage(
+            url="https://test.org",
+            title="Home",
+            description="Homepage",
+            headings=["Welcome"],
+            body_text="Welcome to our charity",
+            page_type=PageType.HOME,
+        ),
+        ExtractedPage(
+            url="https://test.org/about",
+            title="About Us",
+            description="Learn about our work",
+            headings=["Who We Are"],
+            body_text="About our charity",
+            page_type=PageType.ABOUT,
+        ),
+    ]
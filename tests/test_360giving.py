@@ -1,12 +1,16 @@
 """Tests for 360Giving enricher."""
 
 import pytest
+import numpy as np
 import pandas as pd
 from llmstxt_social.enrichers.threesixty_giving import (
     _similar_names,
     _extract_themes,
     _assess_data_quality,
     _analyze_grants_dataframe,
+    _name_tokens,
+    _Registry,
+    _search_registry,
 )
 
 
@@ -49,7 +53,7 @@ def test_assess_data_quality_excellent():
     """Test data quality assessment - excellent quality."""
     df = pd.DataFrame({
         'amount': [1000, 2000, 3000],
-        'award_date': pd.to_datetime(['2025-01-01', '2025-02-01', '2025-03-01']),
+        'award_date': np.array(['2025-01-01', '2025-02-01', '2025-03-01'], dtype='datetime64[D]'),
         'recipient': ['Org A', 'Org B', 'Org C'],
         'description': ['Project 1', 'Project 2', 'Project 3']
     })
@@ -68,21 +72,9 @@ def test_assess_data_quality_basic():
     assert quality == "Basic"
 
 
-def test_analyze_grants_dataframe():
+def test_analyze_grants_dataframe(sample_grants_df):
     """Test analyzing a 360Giving grants dataframe."""
-    df = pd.DataFrame({
-        'Amount Awarded': [1000, 2000, 3000, 4000, 5000],
-        'Award Date': pd.to_datetime(['2024-01-01', '2024-03-01', '2024-06-01', '2024-09-01', '2024-12-01']),
-        'Recipient Org:Name': ['Org A', 'Org B', 'Org C', 'Org D', 'Org E'],
-        'Beneficiary Location:Name': ['London', 'Manchester', 'London', 'Birmingham', 'London'],
-        'Description': [
-            'Youth project',
-            'Health initiative',
-            'Education program',
-            'Community development',
-            'Arts project'
-        ]
-    })
+    df = sample_grants_df
 
     result = _analyze_grants_dataframe(df, "Test Foundation")
 
@@ -100,12 +92,9 @@ def test_analyze_grants_dataframe():
     assert result.data_quality_score in ["Basic", "Good", "Excellent"]
 
 
-def test_analyze_grants_dataframe_minimal():
+def test_analyze_grants_dataframe_minimal(sample_grants_df):
     """Test analyzing a minimal dataframe."""
-    df = pd.DataFrame({
-        'Amount Awarded': [1000, 2000],
-        'Recipient Org:Name': ['Org A', 'Org B'],
-    })
+    df = sample_grants_df[['Amount Awarded', 'Recipient Org:Name']].iloc[:2]
 
     result = _analyze_grants_dataframe(df, "Minimal Foundation")
 
@@ -118,7 +107,7 @@ def test_grants_over_time():
     """Test grants over time analysis."""
     df = pd.DataFrame({
         'Amount Awarded': [1000, 2000, 3000, 4000],
-        'Award Date': pd.to_datetime(['2023-01-01', '2023-06-01', '2024-01-01', '2024-06-01']),
+        'Award Date': np.array(['2023-01-01', '2023-06-01', '2024-01-01', '2024-06-01'], dtype='datetime64[D]'),
         'Recipient Org:Name': ['Org A', 'Org B', 'Org C', 'Org D'],
     })
 
@@ -132,3 +121,69 @@ def test_grants_over_time():
     assert result.grants_over_time[2024]['count'] == 2
     assert result.grants_over_time[2023]['total'] == 3000.0
     assert result.grants_over_time[2024]['total'] == 7000.0
+
+
+def test_mixed_format_award_dates():
+    """Test that plain dates, datetimes and UTC offsets are all parsed."""
+    recent = (pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=30)).strftime('%Y-%m-%d')
+    df = pd.DataFrame({
+        'amount': [1000, 2000, 3000],
+        'award_date': ['2019-01-05', f'{recent}T10:00:00', f'{recent}T00:00:00+01:00'],
+        'recipient': ['Org A', 'Org B', 'Org C'],
+        'description': ['Project 1', 'Project 2', 'Project 3'],
+    })
+
+    # Freshness comes from the most recent date, whatever its format
+    assert _assess_data_quality(df) == "Excellent"
+
+    raw_df = df.rename(columns={
+        'amount': 'Amount Awarded',
+        'award_date': 'Award Date',
+        'recipient': 'Recipient Org:Name',
+        'description': 'Description',
+    })
+    result = _analyze_grants_dataframe(raw_df, "Test Foundation")
+
+    assert result is not None
+    assert sum(year['count'] for year in result.grants_over_time.values()) == 3
+    assert result.data_quality_score == "Excellent"
+
+
+def _registry(publishers):
+    """Build a registry the way _load_registry indexes it."""
+    names = [publisher.get("name", "").lower() for publisher in publishers]
+    by_charity_number = {}
+    for publisher in publishers:
+        if publisher.get("charity_number"):
+            by_charity_number.setdefault(publisher["charity_number"], publisher)
+    return _Registry(
+        publishers=publishers,
+        names=names,
+        name_tokens=[_name_tokens(name) for name in names],
+        by_charity_number=by_charity_number
+    )
+
+
+def test_search_registry_charity_number_match():
+    """Test that a charity number match wins even if the names differ."""
+    renamed = {"name": "Acme Community Trust", "charity_number": "1234567"}
+    registry = _registry([
+        {"name": "Smith Foundation", "charity_number": "7654321"},
+        renamed,
+    ])
+
+    assert _search_registry(registry, "Smith Foundation", "1234567") is renamed
+
+
+def test_search_registry_name_fallback():
+    """Test name matching when the charity number is missing or unknown."""
+    smith = {"name": "The Smith Foundation", "charity_number": "7654321"}
+    jones = {"name": "Jones Trust"}
+    registry = _registry([smith, jones])
+
+    assert _search_registry(registry, "Smith Foundation", None) is smith
+    assert _search_registry(registry, "Jones Trust", "1111111") is jones
+    assert _search_registry(registry, "Brown Fund", None) is None
+
+    # A name match with a different charity number is rejected
+    assert _search_registry(registry, "Smith Foundation", "1111111") is None
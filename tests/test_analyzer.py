@@ -0,0 +1,347 @@
+"""Tests for Claude response handling in the analyzer."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from llmstxt_social import analyzer
+from llmstxt_social.analyzer import (
+    FunderAnalysis,
+    OrganisationAnalysis,
+    StartupAnalysis,
+    _from_dict,
+    _get_client,
+    _parse_response,
+    _request_params,
+    analyze_organisation,
+    analyze_organisations,
+)
+
+CHARITY_RESPONSE = {
+    "name": "Test Charity",
+    "org_type": "charity",
+    "registration_number": "1234567",
+    "mission": "Helping people",
+    "description": "We help people.",
+    "geographic_area": "Leeds",
+    "beneficiaries": "Adults",
+    "services": [{"name": "Advice", "description": "Free advice", "eligibility": "Anyone"}],
+}
+
+
+def _message(text: str) -> SimpleNamespace:
+    """A stub Messages API response."""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(
+            input_tokens=100,
+            output_tokens=50,
+            cache_read_input_tokens=0,
+            cache_creation_input_tokens=0,
+        ),
+    )
+
+
+class StubMessages:
+    """Stands in for AsyncAnthropic().messages, recording create() calls."""
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return _message(self.text)
+
+
+class StubBatches:
+    """Stands in for AsyncAnthropic().messages.batches."""
+
+    def __init__(self, results: list[SimpleNamespace]):
+        self.results_to_return = results
+        self.requests = None
+        self.create_kwargs = None
+        self.retrieved = 0
+
+    async def create(self, requests, **kwargs):
+        self.requests = requests
+        self.create_kwargs = kwargs
+        return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        self.retrieved += 1
+        return SimpleNamespace(id=batch_id, processing_status="ended")
+
+    async def results(self, batch_id):
+        async def entries():
+            for entry in self.results_to_return:
+                yield entry
+        return entries()
+
+
+def _batch_entry(custom_id: str, result_type: str, text: str = "") -> SimpleNamespace:
+    """A stub batch result entry."""
+    message = _message(text) if result_type == "succeeded" else None
+    return SimpleNamespace(
+        custom_id=custom_id,
+        result=SimpleNamespace(type=result_type, message=message),
+    )
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    """Replace the shared AsyncAnthropic client with a stub."""
+    client = SimpleNamespace(messages=StubMessages(json.dumps(CHARITY_RESPONSE)))
+    monkeypatch.setattr(analyzer, "_get_client", lambda api_key: client)
+    return client
+
+
+def test_from_dict_fills_missing_fields():
+    """Test that missing optional and defaulted fields are filled in."""
+    analysis = _from_dict(OrganisationAnalysis, {
+        "name": "Test Charity",
+        "org_type": "charity",
+        "mission": "Helping people",
+        "description": "We help people.",
+        "geographic_area": "Leeds",
+        "beneficiaries": "Adults",
+    })
+
+    assert analysis.name == "Test Charity"
+    assert analysis.registration_number is None
+    assert analysis.projects is None
+    assert analysis.services == []
+    assert analysis.contact == {}
+    assert analysis.ai_guidance == []
+
+
+def test_from_dict_defaults_are_not_shared():
+    """Test that each analysis gets its own default containers."""
+    data = {
+        "name": "Fund",
+        "funder_type": "independent",
+        "mission": "Funding",
+        "description": "We fund.",
+        "geographic_focus": "UK",
+    }
+
+    first = _from_dict(FunderAnalysis, data)
+    second = _from_dict(FunderAnalysis, data)
+
+    assert first.application_process == ""
+    assert first.programmes == []
+    assert first.programmes is not second.programmes
+
+
+def test_from_dict_missing_required_field():
+    """Test that a response without a required field is rejected."""
+    with pytest.raises(KeyError, match="mission"):
+        _from_dict(OrganisationAnalysis, {
+            "name": "Test Charity",
+            "org_type": "charity",
+            "description": "We help people.",
+            "geographic_area": "Leeds",
+            "beneficiaries": "Adults",
+        })
+
+
+def test_parse_response_json():
+    """Test parsing a bare JSON response."""
+    analysis = _parse_response(json.dumps(CHARITY_RESPONSE), "charity")
+
+    assert isinstance(analysis, OrganisationAnalysis)
+    assert analysis.registration_number == "1234567"
+    assert analysis.services[0]["name"] == "Advice"
+
+
+def test_parse_response_code_blocks():
+    """Test parsing JSON wrapped in markdown code blocks."""
+    body = json.dumps(CHARITY_RESPONSE)
+
+    fenced_json = _parse_response(f"Here you go:\n```json\n{body}\n```\nDone.", "charity")
+    fenced = _parse_response(f"```\n{body}\n```", "charity")
+
+    assert fenced_json.name == fenced.name == "Test Charity"
+
+
+def test_parse_response_template_class():
+    """Test that the template selects the analysis dataclass."""
+    startup = {
+        "name": "Startup",
+        "mission": "Ship",
+        "description": "We ship.",
+        "product_description": "An app",
+        "target_customers": "Charities",
+    }
+
+    assert isinstance(_parse_response(json.dumps(startup), "startup"), StartupAnalysis)
+
+
+def test_parse_response_invalid_json():
+    """Test that invalid JSON raises ValueError with or without orjson."""
+    with pytest.raises(ValueError):
+        _parse_response("not json", "charity")
+
+
+async def test_analyze_organisation(stub_client, sample_charity_pages):
+    """Test a single analysis through the async client."""
+    analysis = await analyze_organisation(sample_charity_pages, api_key="sk-ant-test")
+
+    assert isinstance(analysis, OrganisationAnalysis)
+    assert analysis.name == "Test Charity"
+
+    (call,) = stub_client.messages.calls
+    assert call["model"] == "claude-sonnet-4-20250514"
+    assert "https://test.org/about" in call["messages"][0]["content"][0]["text"]
+
+
+async def test_analyze_organisation_requires_api_key(
+    stub_client, monkeypatch, sample_charity_pages
+):
+    """Test that a missing API key is reported before calling Claude."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
+        await analyze_organisation(sample_charity_pages)
+    assert stub_client.messages.calls == []
+
+
+async def test_get_client_reused_per_key():
+    """Test that clients are shared per API key within an event loop."""
+    first = _get_client("sk-ant-one")
+
+    assert _get_client("sk-ant-one") is first
+    assert _get_client("sk-ant-two") is not first
+
+
+def _cache_controls(params: dict) -> list[dict]:
+    """The cache_control blocks on the system prompt and page corpus."""
+    return [
+        params["system"][0]["cache_control"],
+        params["messages"][0]["content"][0]["cache_control"],
+    ]
+
+
+def test_request_params_cache_control(monkeypatch, sample_charity_pages):
+    """Test that the system prompt and pages use the default 5-minute cache."""
+    monkeypatch.delenv("LLMSTXT_LONG_CACHE", raising=False)
+
+    params = _request_params(sample_charity_pages, "funder", "claude-test")
+
+    assert params["model"] == "claude-test"
+    assert params["system"][0]["text"] == analyzer.FUNDER_SYSTEM_PROMPT
+    assert _cache_controls(params) == [{"type": "ephemeral"}, {"type": "ephemeral"}]
+
+
+def test_request_params_long_cache(monkeypatch, sample_charity_pages):
+    """Test that LLMSTXT_LONG_CACHE selects the 1-hour cache TTL."""
+    monkeypatch.setenv("LLMSTXT_LONG_CACHE", "1")
+
+    params = _request_params(sample_charity_pages, "charity", "claude-test")
+
+    assert _cache_controls(params) == [
+        {"type": "ephemeral", "ttl": "1h"},
+        {"type": "ephemeral", "ttl": "1h"},
+    ]
+
+
+@pytest.mark.parametrize("long_cache, saving", [
+    ("", 900 - 250),
+    ("1", 900 - 1000),
+])
+def test_cache_saving(monkeypatch, long_cache, saving):
+    """Test that 1-hour cache writes are charged at 2x the input price."""
+    monkeypatch.setenv("LLMSTXT_LONG_CACHE", long_cache)
+    counts = {"cache_read_input_tokens": 1000, "cache_creation_input_tokens": 1000}
+
+    assert analyzer._cache_saving(counts) == saving
+
+
+@pytest.mark.parametrize("long_cache, headers", [
+    ("", {}),
+    ("1", {"anthropic-beta": "extended-cache-ttl-2025-04-11"}),
+])
+async def test_analyze_organisation_cache_headers(
+    stub_client, monkeypatch, sample_charity_pages, long_cache, headers
+):
+    """Test that the extended cache TTL beta header is only sent when enabled."""
+    monkeypatch.setenv("LLMSTXT_LONG_CACHE", long_cache)
+
+    await analyze_organisation(sample_charity_pages, api_key="sk-ant-test")
+
+    assert stub_client.messages.calls[0]["extra_headers"] == headers
+
+
+def _named_response(name: str) -> str:
+    return json.dumps({**CHARITY_RESPONSE, "name": name})
+
+
+async def test_analyze_organisations_batch(stub_client, sample_charity_pages):
+    """Test that batch results are matched to inputs by custom_id."""
+    batches = stub_client.messages.batches = StubBatches([
+        # Results arrive out of request order
+        _batch_entry("org-2", "succeeded", _named_response("Third")),
+        _batch_entry("org-0", "succeeded", _named_response("First")),
+        _batch_entry("org-1", "errored"),
+        _batch_entry("org-3", "expired"),
+        _batch_entry("org-4", "succeeded", '{"name": "Missing fields"}'),
+    ])
+
+    analyses = await analyze_organisations(
+        [sample_charity_pages] * 5, api_key="sk-ant-test", poll_interval=0
+    )
+
+    assert [request["custom_id"] for request in batches.requests] == [
+        "org-0", "org-1", "org-2", "org-3", "org-4"
+    ]
+    assert batches.retrieved == 1
+    assert analyses[0].name == "First"
+    assert analyses[2].name == "Third"
+    # Errored, expired and unparseable entries become None
+    assert analyses[1] is None
+    assert analyses[3] is None
+    assert analyses[4] is None
+
+
+async def test_analyze_organisations_malformed_entries(stub_client, sample_charity_pages):
+    """Test that empty or non-object responses don't discard the batch."""
+    empty = _batch_entry("org-0", "succeeded")
+    empty.result.message.content = []
+    stub_client.messages.batches = StubBatches([
+        empty,
+        _batch_entry("org-1", "succeeded", "[1, 2]"),
+        _batch_entry("org-2", "succeeded", "42"),
+        _batch_entry("org-3", "succeeded", _named_response("Fourth")),
+    ])
+
+    analyses = await analyze_organisations(
+        [sample_charity_pages] * 4, api_key="sk-ant-test", poll_interval=0
+    )
+
+    assert analyses[:3] == [None, None, None]
+    assert analyses[3].name == "Fourth"
+
+
+async def test_analyze_organisations_long_cache(stub_client, monkeypatch, sample_charity_pages):
+    """Test that batch requests use the configured cache TTL."""
+    monkeypatch.setenv("LLMSTXT_LONG_CACHE", "1")
+    batches = stub_client.messages.batches = StubBatches([])
+
+    analyses = await analyze_organisations(
+        [sample_charity_pages], api_key="sk-ant-test", poll_interval=0
+    )
+
+    assert analyses == [None]
+    assert _cache_controls(batches.requests[0]["params"])[0] == {"type": "ephemeral", "ttl": "1h"}
+    assert batches.create_kwargs["extra_headers"] == {
+        "anthropic-beta": "extended-cache-ttl-2025-04-11"
+    }
+
+
+async def test_analyze_organisations_empty(stub_client):
+    """Test that no batch is created for an empty input list."""
+    stub_client.messages.batches = StubBatches([])
+
+    assert await analyze_organisations([], api_key="sk-ant-test") == []
+    assert stub_client.messages.batches.requests is None
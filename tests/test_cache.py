@@ -0,0 +1,82 @@
+"""Tests for the on-disk cache."""
+
+import os
+import time
+
+import pytest
+
+from llmstxt_social import cache
+from llmstxt_social.enrichers import charity_commission
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLMSTXT_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("LLMSTXT_NO_CACHE", raising=False)
+    return tmp_path
+
+
+def test_store_and_load():
+    """Test that stored values round-trip."""
+    value = {"name": "Test Charity", "trustees": ["Alice"]}
+    cache.store("charity_commission", "1234567", value)
+
+    assert cache.load("charity_commission", "1234567") == value
+    assert cache.load("charity_commission", "7654321") is None
+
+
+def test_load_expired(cache_dir):
+    """Test that entries older than the TTL are ignored."""
+    cache.store("charity_commission", "1234567", {"name": "Test Charity"})
+
+    stale = time.time() - cache.DEFAULT_TTL - 1
+    for path in cache_dir.rglob("*.json"):
+        os.utime(path, (stale, stale))
+
+    assert cache.load("charity_commission", "1234567") is None
+
+
+def test_cache_disabled(monkeypatch):
+    """Test that LLMSTXT_NO_CACHE skips the cache."""
+    monkeypatch.setenv("LLMSTXT_NO_CACHE", "1")
+    cache.store("charity_commission", "1234567", {"name": "Test Charity"})
+
+    assert cache.load("charity_commission", "1234567") is None
+
+
+def test_store_and_load_bytes():
+    """Test that raw downloads round-trip separately from JSON values."""
+    url = "https://example.org/grants.csv"
+    cache.store_bytes("360giving", url, b"Amount Awarded\n1000\n")
+
+    assert cache.load_bytes("360giving", url) == b"Amount Awarded\n1000\n"
+    assert cache.load("360giving", url) is None
+
+
+@pytest.mark.parametrize("name, cached", [("Test Charity", True), ("Unknown", False)])
+async def test_fetch_charity_data_caches_found_charities(monkeypatch, name, cached):
+    """Test that a placeholder result from a failed lookup is not cached."""
+    async def fetch_from_public_register(charity_number):
+        return charity_commission.CharityData(
+            name=name,
+            number=charity_number,
+            status="Registered",
+            date_registered=None,
+            date_removed=None,
+            latest_income=None,
+            latest_expenditure=None,
+            charitable_objects=None,
+            activities=None,
+            trustees=[],
+            contact={}
+        )
+
+    monkeypatch.delenv("CHARITY_COMMISSION_API_KEY", raising=False)
+    monkeypatch.setattr(
+        charity_commission, "_fetch_from_public_register", fetch_from_public_register
+    )
+
+    data = await charity_commission.fetch_charity_data("1234567")
+
+    assert data.name == name
+    assert (cache.load("charity_commission", "1234567") is not None) == cached
@@ -1,9 +1,11 @@
 """Tests for Charity Commission enricher."""
 
 import pytest
+from llmstxt_social.enrichers import charity_commission
 from llmstxt_social.enrichers.charity_commission import (
     find_charity_number,
     _parse_api_response,
+    _parse_register_page,
 )
 from llmstxt_social.extractor import ExtractedPage, PageType
 
@@ -70,6 +72,86 @@ def test_find_charity_number_from_page_attribute():
     assert result == "1234567"
 
 
+def test_find_charity_number_matches_extractor():
+    """Test that phrasings the enricher accepts are also found by extract_content."""
+    from llmstxt_social.crawler import Page
+    from llmstxt_social.extractor import extract_content
+
+    for text, expected in [
+        ("England and Wales registration 1234567", "1234567"),
+        ("Charity Commission registration 123456", "123456"),
+        ("E&W reg. 7654321", "7654321"),
+    ]:
+        html = f"<html><body><main><p>Hello</p></main><footer>{text}</footer></body></html>"
+        page = extract_content(Page(url="https://example.org", title="Test", html=html, status_code=200))
+        assert page.charity_number == expected
+
+        unscanned = ExtractedPage(
+            url="https://example.org",
+            title="Test",
+            description=None,
+            headings=[],
+            body_text=text,
+            page_type=PageType.HOME,
+        )
+        assert find_charity_number([unscanned]) == expected
+
+
+def test_find_charity_number_skips_scanned_pages():
+    """Test that pages already searched by extract_content are not searched again."""
+    pages = [
+        ExtractedPage(
+            url="https://example.org",
+            title="Test",
+            description=None,
+            headings=[],
+            body_text="Registered charity no. 123456",
+            page_type=PageType.HOME,
+            charity_number=None,
+            charity_scanned=True
+        )
+    ]
+
+    assert find_charity_number(pages) is None
+
+
+def _page(url, body_text, page_type):
+    return ExtractedPage(
+        url=url,
+        title="Test",
+        description=None,
+        headings=[],
+        body_text=body_text,
+        page_type=page_type
+    )
+
+
+def test_find_charity_number_searches_priority_pages_first():
+    """Test that key pages are searched before pages listed earlier."""
+    pages = [
+        _page("https://example.org/news", "Registered charity no. 1111111", PageType.NEWS),
+        _page("https://example.org/about", "Registered charity no. 2222222", PageType.ABOUT),
+    ]
+
+    assert find_charity_number(pages) == "2222222"
+
+
+def test_find_charity_number_searches_each_page_once(monkeypatch):
+    """Test that every page is searched exactly once, priority pages first."""
+    searched = []
+    monkeypatch.setattr(
+        charity_commission, "_extract_charity_number", lambda text: searched.append(text)
+    )
+    about = _page("https://example.org/about", "about", PageType.ABOUT)
+    news = _page("https://example.org/news", "news", PageType.NEWS)
+    # Equal to news but a separate page, so it is searched too
+    news_copy = _page("https://example.org/news", "news", PageType.NEWS)
+    contact = _page("https://example.org/contact", "contact", PageType.CONTACT)
+
+    assert find_charity_number([news, about, news_copy, contact]) is None
+    assert searched == ["about", "contact", "news", "news"]
+
+
 def test_parse_api_response():
     """Test parsing Charity Commission API response."""
     mock_response = {
@@ -126,3 +208,62 @@ def test_parse_api_response_missing_fields():
     assert result.latest_income is None
     assert result.latest_expenditure is None
     assert len(result.trustees) == 0
+
+
+def test_parse_register_page():
+    """Test parsing a public register page."""
+    html = """
+    <html>
+        <body>
+            <header><h1>Register of Charities</h1></header>
+            <main>
+                <h1 class="charity-heading">THE EXAMPLE TRUST</h1>
+                <span class="charity-status">Registered</span>
+                <table>
+                    <tr><th>Registered</th><td>01 January 1990</td></tr>
+                    <tr><th>Total income</th><td>£1,234,567</td></tr>
+                    <tr><th>Total spending</th><td>£987,654</td></tr>
+                </table>
+                <h3>What the charity does</h3><div>Helps people in need</div>
+                <h3>How the charity works</h3><div>Grants to organisations</div>
+                <h2>Trustees</h2><ul><li>Alice Smith</li><li>Bob Jones</li></ul>
+                <h3>Contact information</h3><div>info@example.org 01612345678</div>
+            </main>
+        </body>
+    </html>
+    """
+
+    result = _parse_register_page(html, "1234567")
+
+    assert result.name == "THE EXAMPLE TRUST"
+    assert result.number == "1234567"
+    assert result.status == "Registered"
+    assert result.date_registered == "01 January 1990"
+    assert result.latest_income == 1234567
+    assert result.latest_expenditure == 987654
+    assert result.charitable_objects == "Helps people in need"
+    assert result.activities == "Grants to organisations"
+    assert result.trustees == ["Alice Smith", "Bob Jones"]
+    assert result.contact == {"email": "info@example.org", "phone": "01612345678"}
+
+
+def test_parse_register_page_non_breaking_spaces():
+    """Test amounts that use non-breaking spaces as thousands separators."""
+    html = """
+    <html>
+        <body>
+            <main>
+                <h1 class="charity-heading">THE EXAMPLE TRUST</h1>
+                <table>
+                    <tr><th>Total income</th><td>£1&nbsp;234&nbsp;567</td></tr>
+                    <tr><th>Total spending</th><td>£987&#8239;654</td></tr>
+                </table>
+            </main>
+        </body>
+    </html>
+    """
+
+    result = _parse_register_page(html, "1234567")
+
+    assert result.latest_income == 1234567
+    assert result.latest_expenditure == 987654
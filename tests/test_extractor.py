@@ -5,6 +5,9 @@ from llmstxt_social.crawler import Page
 from llmstxt_social.extractor import (
     extract_content,
     classify_page_type,
+    deduplicate_pages,
+    extract_charity_number_only,
+    ExtractedPage,
     PageType,
     _extract_charity_number,
 )
@@ -36,7 +39,10 @@ def test_extract_charity_number():
         ("Registered charity number: 1234567", "1234567"),
         ("Charity no. 123456", "123456"),
         ("We are a registered charity 9876543 in England and Wales", "9876543"),
+        ("Registered in E & W 1122334", "1122334"),
+        ("REGISTERED CHARITY NO. 1094112", "1094112"),
         ("No charity number here", None),
+        ("Call 0207 1234567 for help", None),
     ]
 
     for text, expected in test_cases:
@@ -44,6 +50,21 @@ def test_extract_charity_number():
         assert result == expected
 
 
+def test_extract_charity_number_only():
+    """Test charity number extraction straight from HTML."""
+    html = """
+    <html>
+        <body>
+            <main><p>Welcome</p></main>
+            <footer><p>Registered in <strong>England &amp; Wales</strong> No. 1094112</p></footer>
+        </body>
+    </html>
+    """
+
+    assert extract_charity_number_only(html) == "1094112"
+    assert extract_charity_number_only("<p>No number here</p>") is None
+
+
 def test_classify_page_type_about():
     """Test classification of about pages."""
     page_type = classify_page_type(
@@ -77,6 +98,17 @@ def test_classify_page_type_services():
     assert page_type == PageType.SERVICES
 
 
+def test_classify_page_type_priority():
+    """Test that page type priority, not match position, decides the type."""
+    page_type = classify_page_type(
+        url="https://example.org/news/contact-changes",
+        title="Latest news",
+        headings=[],
+        body_text="Our team has new phone numbers"
+    )
+    assert page_type == PageType.CONTACT
+
+
 def test_classify_page_type_home():
     """Test classification of home page."""
     page_type = classify_page_type(
@@ -127,3 +159,26 @@ def test_body_text_extraction():
     # Scripts and styles should not be in body text
     assert "var x = 1" not in extracted.body_text
     assert "color: red" not in extracted.body_text
+
+
+def test_deduplicate_pages():
+    """Test that pages with the same body text are only kept once."""
+    def make_page(url, body_text):
+        return ExtractedPage(
+            url=url,
+            title="Test",
+            description=None,
+            headings=[],
+            body_text=body_text,
+            page_type=PageType.OTHER
+        )
+
+    pages = [
+        make_page("https://example.org/news", "Latest news from the charity"),
+        make_page("https://example.org/news?print=1", "Latest  news from\nthe charity"),
+        make_page("https://example.org/about", "About the charity"),
+    ]
+
+    unique = deduplicate_pages(pages)
+
+    assert [p.url for p in unique] == ["https://example.org/news", "https://example.org/about"]
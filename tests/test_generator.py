@@ -6,7 +6,7 @@ from llmstxt_social.extractor import ExtractedPage, PageType
 from llmstxt_social.generator import generate_charity_llmstxt, generate_funder_llmstxt
 
 
-def test_generate_charity_llmstxt():
+def test_generate_charity_llmstxt(sample_charity_pages):
     """Test charity llms.txt generation."""
     analysis = OrganisationAnalysis(
         name="Test Charity",
@@ -29,26 +29,7 @@ def test_generate_charity_llmstxt():
         ai_guidance=["Always verify service availability"]
     )
 
-    pages = [
-        ExtractedPage(
-            url="https://test.org",
-            title="Home",
-            description="Homepage",
-            headings=["Welcome"],
-            body_text="Welcome to our charity",
-            page_type=PageType.HOME,
-        ),
-        ExtractedPage(
-            url="https://test.org/about",
-            title="About Us",
-            description="Learn about our work",
-            headings=["Who We Are"],
-            body_text="About our charity",
-            page_type=PageType.ABOUT,
-        ),
-    ]
-
-    result = generate_charity_llmstxt(analysis, pages)
+    result = generate_charity_llmstxt(analysis, sample_charity_pages)
 
     # Check structure
     assert result.startswith("# Test Charity")